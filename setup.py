@@ -16,10 +16,13 @@
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
 import pathlib
+import re
 
 import setuptools
 import setuptools.command.build_py
 
+EXCLUDE = re.compile(r"(?:_test\.py$|/testdata/|(?:^|/)conftest\.py$)")
+
 
 class build_py(setuptools.command.build_py.build_py):
     """Specialize Python source builder to exclude '_test.py' files."""
@@ -28,12 +31,7 @@ class build_py(setuptools.command.build_py.build_py):
 
     def find_package_modules(self, package, package_dir):
         modules = super().find_package_modules(package, package_dir)
-        return filter(
-            lambda m: not m[2].endswith("_test.py")
-            and not "/testdata/" in m[2]
-            and m[2].rpartition("/")[-1] != "conftest.py",
-            modules,
-        )
+        return [m for m in modules if not EXCLUDE.search(m[2])]
 
 
 setuptools.setup(
@@ -77,7 +75,6 @@ setuptools.setup(
         "flask ~= 1.0",
         "mypy-extensions ~= 0.4",
         "pygments ~= 2.4",
-        "pyjwt ~= 1.7",
         "requests ~= 2.22",
         "semver ~= 2.8",
         "ruamel.yaml ~= 0.15",
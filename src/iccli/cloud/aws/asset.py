@@ -18,11 +18,25 @@
 import importlib.machinery
 import importlib.resources
 import pathlib
+from functools import lru_cache
+from typing import Optional, Tuple, cast
 
 from . import types, util
 
 
+@lru_cache(maxsize=None)
+def _contents(package: str) -> Tuple[str, ...]:
+    return tuple(importlib.resources.contents(package))
+
+
+@lru_cache(maxsize=None)
+def _is_resource(package: str, name: str) -> bool:
+    return importlib.resources.is_resource(package, name)
+
+
 class Asset:
+    __slots__ = ("_package", "_name", "_info", "_path", "_text", "_key", "_hash")
+
     def __init__(
         self, package: str, name: str, path: pathlib.Path, info: util.AssetInfo
     ):
@@ -30,11 +44,16 @@ class Asset:
         self._name = name
         self._info = info
         self._path = path
+        self._text = cast(Optional[str], None)
+        self._key = str(path)
+        self._hash = hash(path)
 
     def __hash__(self):
-        return hash(self._path)
+        return self._hash
 
     def __eq__(self, other):
+        if isinstance(other, Asset):
+            return self._key == other._key
         return self._path == other
 
     def __str__(self):  # pragma: no cover
@@ -46,7 +65,9 @@ class Asset:
 
     @property
     def text(self) -> types.BridgeStr:
-        return types.BridgeStr(importlib.resources.read_text(self._package, self._name))
+        if self._text is None:
+            self._text = importlib.resources.read_text(self._package, self._name)
+        return types.BridgeStr(self._text)
 
     @property
     def url(self) -> types.BridgeStr:
@@ -65,20 +86,27 @@ class Asset:
         return self._info.key
 
     def __bool__(self) -> bool:
-        return importlib.resources.is_resource(self._package, self.name)
+        return _is_resource(self._package, self._name)
 
 
 class Assets:
     def __init__(self, package: str):
         self._package = package
 
+    def _asset(self, item: str) -> Asset:
+        with importlib.resources.path(self._package, item) as path:
+            return Asset(self._package, item, path, util.asset_info(path))
+
     def __getitem__(self, item: str):
         from . import config
 
-        with importlib.resources.path(self._package, item) as path:
-            asset = Asset(self._package, item, path, util.asset_info(path))
-            config.ASSETS.get().add(asset)
-            return asset
+        asset = self._asset(item)
+        config.ASSETS.get().add(asset)
+        return asset
 
     def __iter__(self):
-        yield from (self[r] for r in importlib.resources.contents(self._package))
+        from . import config
+
+        assets = [self._asset(r) for r in _contents(self._package)]
+        config.ASSETS.get().update(assets)
+        yield from assets
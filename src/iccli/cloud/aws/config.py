@@ -16,18 +16,19 @@
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
 from contextvars import ContextVar
-from typing import List, Set
-
-import boto3
+from typing import TYPE_CHECKING, List, Set
 
 from . import types
 
+if TYPE_CHECKING:  # pragma: no cover
+    import boto3  # only needed for annotations, slow to import
+
 # SENSITIVES and ASSETS must be reset before each build.
 
 SENSITIVES: ContextVar[List[types.Sensitive]] = ContextVar("sensitives")
 PROFILE: ContextVar[str] = ContextVar("profile")
 REGION: ContextVar[str] = ContextVar("region")
-SESSION: ContextVar[boto3.Session] = ContextVar("session")
+SESSION: ContextVar["boto3.Session"] = ContextVar("session")
 S3_BUCKET: ContextVar[str] = ContextVar("s3_bucket")
 S3_PREFIX: ContextVar[str] = ContextVar("s3_prefix")
 ASSETS: ContextVar[Set] = ContextVar("assets")
@@ -18,53 +18,70 @@
 import json
 import re
 from datetime import date, datetime
-from typing import Any, Mapping, MutableMapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Mapping, MutableMapping, Optional, Type
 
 from ...core.resource import Resource, ResourceInfo
 from . import config, types
-from .resources import Resource as AWSResource
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .resources import Resource as AWSResource
+
+
+_UNQUOTE = re.compile(r'"##(\$\{A\d+\})##"')
+
+_ACCOUNT_ID = {"Ref": "AWS::AccountId"}
+_NOTIFICATION_ARNS = {"Ref": "AWS::NotificationARNs"}
+_PARTITION = {"Ref": "AWS::Partition"}
+_REGION = {"Ref": "AWS::Region"}
+_STACK_ID = {"Ref": "AWS::StackId"}
+_URL_SUFFIX = {"Ref": "AWS::URLSuffix"}
+
+_HANDLERS: Mapping[type, Callable[[Any], Any]] = {
+    types.Sensitive: lambda n: {"Ref": n.name},
+    types.Attr: lambda n: {"Fn::GetAtt": [n.rid, n.name]},
+    types.Join: lambda n: {"Fn::Join": [n.delim, n.args]},
+    types.Ref: lambda n: {"Ref": n.rid},
+    types.Select: lambda n: {"Fn::Select": [n.item, n.args]},
+    types.Split: lambda n: {"Fn::Split": [n.sep, n.arg]},
+    types.Sub: lambda n: {"Fn::Sub": [n.fmt, n.args]},
+    types.AvailabilityZones: lambda n: {"Fn::GetAZs": n.region},
+    types.Base64Encode: lambda n: {"Fn::Base64": n.arg},
+    types.CIDR: lambda n: {"Fn::Cidr": [n.block, n.count, n.bits]},
+    types.AccountID: lambda _: _ACCOUNT_ID,
+    types.NotificationARNs: lambda _: _NOTIFICATION_ARNS,
+    types.Partition: lambda _: _PARTITION,
+    types.Region: lambda _: _REGION,
+    types.StackID: lambda _: _STACK_ID,
+    types.URLSuffix: lambda _: _URL_SUFFIX,
+}
+
+
+@lru_cache(maxsize=None)
+def _handler(typ: type) -> Optional[Callable[[Any], Any]]:
+    # dynamic subclasses (e.g. `Attr[Str, "name"]`) resolve through their MRO
+    return next((_HANDLERS[t] for t in typ.__mro__ if t in _HANDLERS), None)
 
 
 class JSONEncoder(json.JSONEncoder):
     def default(self, node):
-        # pylint: disable=too-many-return-statements,arguments-differ,method-hidden
+        # pylint: disable=arguments-differ,method-hidden
+        handler = _HANDLERS.get(type(node)) or _handler(type(node))
+        if handler is not None:
+            return handler(node)
         if isinstance(node, (date, datetime)):
             return node.isoformat()
-        if isinstance(node, types.Sensitive):
-            return {"Ref": node.name}
-        if isinstance(node, types.Attr):
-            return {"Fn::GetAtt": [node.rid, node.name]}
-        if isinstance(node, types.Join):
-            return {"Fn::Join": [node.delim, node.args]}
-        if isinstance(node, types.Ref):
-            return {"Ref": node.rid}
-        if isinstance(node, types.Select):
-            return {"Fn::Select": [node.item, node.args]}
-        if isinstance(node, types.Split):
-            return {"Fn::Split": [node.sep, node.arg]}
-        if isinstance(node, types.Sub):
-            return {"Fn::Sub": [node.fmt, node.args]}
-        if isinstance(node, types.AvailabilityZones):
-            return {"Fn::GetAZs": node.region}
-        if isinstance(node, types.Base64Encode):
-            return {"Fn::Base64": node.arg}
-        if isinstance(node, types.CIDR):
-            return {"Fn::Cidr": [node.block, node.count, node.bits]}
-        if isinstance(node, types.AccountID):
-            return {"Ref": "AWS::AccountId"}
-        if isinstance(node, types.NotificationARNs):
-            return {"Ref": "AWS::NotificationARNs"}
-        if isinstance(node, types.Partition):
-            return {"Ref": "AWS::Partition"}
-        if isinstance(node, types.Region):
-            return {"Ref": "AWS::Region"}
-        if isinstance(node, types.StackID):
-            return {"Ref": "AWS::StackId"}
-        if isinstance(node, types.URLSuffix):
-            return {"Ref": "AWS::URLSuffix"}
         return super().default(node)  # pragma: no cover
 
 
+@lru_cache(maxsize=None)
+def _aws_resource() -> Type["AWSResource"]:
+    # the resources package is only imported once a template is encoded
+    from .resources import Resource  # pylint: disable=import-outside-toplevel
+
+    return Resource
+
+
 class Template:
     def __init__(self, node: Resource):
         self.node = node
@@ -74,9 +91,11 @@ class Template:
         return _tree(self.node)
 
     @staticmethod
-    def _json_params(pretty=False):
+    @lru_cache(maxsize=None)
+    def _encoder(pretty=False, cls=json.JSONEncoder) -> json.JSONEncoder:
+        # encoders are stateless between calls, hence shared
         ind, sep = (2, (", ", ": ")) if pretty else (None, (",", ":"))
-        return dict(indent=ind, separators=sep, sort_keys=False)
+        return cls(indent=ind, separators=sep, sort_keys=False)
 
     @property
     def params(self):
@@ -84,15 +103,15 @@ class Template:
         return [dict(ParameterKey=s.name, ParameterValue=s.value) for s in secs]
 
     def dumps_params(self, pretty=False) -> str:
-        return json.dumps(self.params, **self._json_params(pretty))
+        return self._encoder(pretty).encode(self.params)
 
     def dumps_assets(self, pretty=False) -> str:
         # pylint: disable=protected-access
         assets = [
-            dict(bucket=a.bucket, key=a.key, path=str(a._path), uri=a.uri, url=a.url)
+            dict(bucket=a.bucket, key=a.key, path=a._key, uri=a.uri, url=a.url)
             for a in config.ASSETS.get()
         ]
-        return json.dumps(assets, **self._json_params(pretty))
+        return self._encoder(pretty).encode(assets)
 
     def dumps(self, pretty=False) -> str:
         # pylint: disable=protected-access
@@ -107,71 +126,108 @@ class Template:
                 Parameters={s.name: dict(Type="String", NoEcho=True) for s in secs}
             )
         rescs: MutableMapping[str, Any] = {}
-        for res in [r for r in self.node if isinstance(r, AWSResource)]:
-            data: MutableMapping[str, Any] = dict(Type=res._type)
-            if res._reqs:
-                data.update(DependsOn=[r.id for r in res._reqs])
-            if res._deletion:
-                data.update(DeletionPolicy=res._deletion.title())
-            if res.props:
-                data.update(Properties=res._props)
-            rescs[res.id] = data
+        aws_resource = _aws_resource()
+        for res in self.node:
+            if isinstance(res, aws_resource):
+                rescs[res.id] = _render(res)
         if not rescs:  # pragma: no cover
             raise TypeError("expected at least 1 AWS resource, got nothing")
         tpl.update(Resources=rescs)
-        val = self.node if isinstance(self.node, AWSResource) else self.node._value
+        val = self.node if isinstance(self.node, aws_resource) else self.node._value
         if val is not None:
             subs: MutableMapping[str, types.Opaque] = {}
             out: Any = _strip(_output(val, subs))
             out = json.dumps(out, separators=(",", ":"), sort_keys=True)
-            out = re.sub(r'(?:"##)(.+?)(?:##")', r"\1", out)
+            # only bool and int placeholders are quoted and need a rewrite
+            if any(isinstance(v, (types.Bool, types.Int)) for v in subs.values()):
+                out = _UNQUOTE.sub(r"\1", out)
             if subs:
                 out = types.Sub(out, subs)
             tpl.update(Outputs=dict(value=dict(Value=out)))
         tpl = _strip(tpl)
-        return json.dumps(tpl, cls=JSONEncoder, **self._json_params(pretty))
+        return self._encoder(pretty, JSONEncoder).encode(tpl)
+
+
+def _render(res: "AWSResource") -> Mapping[str, Any]:
+    # pylint: disable=protected-access
+    if res._rendered is not None and res._rendered[0] == res._rev:
+        return res._rendered[1]
+    data: MutableMapping[str, Any] = dict(Type=res._type)
+    if res._reqs:
+        data.update(DependsOn=[r.id for r in res._reqs])
+    if res._deletion:
+        data.update(DeletionPolicy=res._deletion.title())
+    if res._props:
+        data.update(Properties=res._props)
+    res._rendered = (res._rev, data)
+    return data
+
+
+def _empty(val: Any) -> bool:
+    # empty lists are meaningful and kept
+    return val is None or (isinstance(val, (str, dict)) and not val)
 
 
 def _strip(data: Any):
-    none: Any = ("", None, {})
+    # containers are only rebuilt when something below them was pruned
     if isinstance(data, dict):
-        new_dict = {}
-        for key, val in data.items():
-            val = _strip(val)
-            if not val in none:
-                new_dict[key] = val
-        return new_dict
+        items = [(key, val, _strip(val)) for key, val in data.items()]
+        if all(new is val and not _empty(new) for _, val, new in items):
+            return data
+        return {key: new for key, _, new in items if not _empty(new)}
     if isinstance(data, list):
-        new_list = []
-        for val in data:
-            val = _strip(val)
-            if not val in none:
-                new_list.append(val)
-        return new_list
+        vals = [(val, _strip(val)) for val in data]
+        if all(new is val and not _empty(new) for val, new in vals):
+            return data
+        return [new for _, new in vals if not _empty(new)]
     return data
 
 
 def _tree(node: Resource) -> Mapping[str, Any]:
-    res: MutableMapping[str, Any] = dict(id=node.id, name=node.name)
-    if isinstance(node, AWSResource):
-        res.update(type=node.type)
-    if node.children:
-        res.update(children=[_tree(c) for c in node.children])
-    return res
+    # children dicts are allocated by their parent and filled in when popped
+    aws_resource = _aws_resource()
+    tree: MutableMapping[str, Any] = {}
+    stack = [(node, tree)]
+    while stack:
+        curr, res = stack.pop()
+        res["id"] = curr.id
+        res["name"] = curr.name
+        if isinstance(curr, aws_resource):
+            res["type"] = curr.type
+        children = curr.children
+        if children:
+            res["children"] = [{} for _ in children]
+            stack.extend(zip(children, res["children"]))
+    return tree
 
 
 def _output(node: Any, subs: MutableMapping[str, types.Opaque]):
-    # pylint: disable=too-many-return-statements,protected-access
-    if isinstance(node, ResourceInfo):
-        node = node._items
-    if isinstance(node, dict):
-        return {k: _output(v, subs) for k, v in node.items() if not k.startswith("_")}
-    if isinstance(node, list):
-        return [_output(v, subs) for v in node]
-    if isinstance(node, AWSResource):
-        return {k: _output(v, subs) for k, v in node._attrs.items()}
-    if not isinstance(node, types.Opaque):
-        return node
+    handler = _OUTPUTS.get(type(node)) or _output_handler(type(node))
+    return handler(node, subs)
+
+
+def _output_scalar(node: Any, _: MutableMapping[str, types.Opaque]):
+    return node
+
+
+def _output_dict(node: Mapping, subs: MutableMapping[str, types.Opaque]):
+    return {k: _output(v, subs) for k, v in node.items() if not k.startswith("_")}
+
+
+def _output_info(node: ResourceInfo, subs: MutableMapping[str, types.Opaque]):
+    return _output_dict(node._items, subs)  # pylint: disable=protected-access
+
+
+def _output_list(node: list, subs: MutableMapping[str, types.Opaque]):
+    return [_output(v, subs) for v in node]
+
+
+def _output_resource(node: "AWSResource", subs: MutableMapping[str, types.Opaque]):
+    # pylint: disable=protected-access
+    return {k: _output(v, subs) for k, v in node._attrs.items()}
+
+
+def _output_opaque(node: types.Opaque, subs: MutableMapping[str, types.Opaque]):
     name = f"A{len(subs)}"
     if isinstance(node, types.List):
         if issubclass(node.select, types.Str):
@@ -187,3 +243,32 @@ def _output(node: Any, subs: MutableMapping[str, types.Opaque]):
         f"values of type {type(node).__name__!r} are not supported "
         f"in return values of AWS bricks"
     )  # pragma: no cover
+
+
+_OUTPUTS: Mapping[type, Callable[[Any, MutableMapping[str, types.Opaque]], Any]] = {
+    str: _output_scalar,
+    int: _output_scalar,
+    float: _output_scalar,
+    bool: _output_scalar,
+    type(None): _output_scalar,
+    dict: _output_dict,
+    list: _output_list,
+}
+
+
+@lru_cache(maxsize=None)
+def _output_handler(
+    typ: type
+) -> Callable[[Any, MutableMapping[str, types.Opaque]], Any]:
+    # pylint: disable=too-many-return-statements
+    if issubclass(typ, ResourceInfo):
+        return _output_info
+    if issubclass(typ, dict):
+        return _output_dict
+    if issubclass(typ, list):
+        return _output_list
+    if issubclass(typ, _aws_resource()):
+        return _output_resource
+    if issubclass(typ, types.Opaque):
+        return _output_opaque
+    return _output_scalar
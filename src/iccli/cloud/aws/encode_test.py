@@ -81,6 +81,22 @@ def test_json_encoder(arg, expected):
     assert json.dumps(arg, cls=encode.JSONEncoder) == json.dumps(expected)
 
 
+@pytest.mark.parametrize(
+    "typ",
+    [
+        types.AccountID,
+        types.NotificationARNs,
+        types.Partition,
+        types.Region,
+        types.StackID,
+        types.URLSuffix,
+    ],
+)
+def test_json_encoder_pseudo(typ):
+    encoder = encode.JSONEncoder()
+    assert encoder.default(typ()) is encoder.default(typ())
+
+
 TEMPLATE1 = json.dumps(
     # pylint: disable=line-too-long
     {
@@ -304,3 +320,21 @@ def test_info():
     node = brick("root")
     tpl = encode.Template(node)
     assert TEMPLATE3 == tpl.dumps()
+
+
+def test_strip():
+    # pylint: disable=protected-access
+    data = dict(a=[1, dict(b="c")], d=True)
+    assert encode._strip(data) is data
+    data = dict(a=[1, None, dict(b="")], c={}, d="", e=[])
+    assert encode._strip(data) == dict(a=[1], e=[])
+
+
+def test_render():
+    # pylint: disable=protected-access
+    spec = resources.load("us-east-1")
+    wch = spec["aws"]["cloudformation"]["wait_condition_handle"]("wch")
+    data = encode._render(wch)
+    assert encode._render(wch) is data
+    wch.deletion = "retain"
+    assert encode._render(wch) == dict(data, DeletionPolicy="Retain")
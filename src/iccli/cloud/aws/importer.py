@@ -20,12 +20,19 @@ import importlib.machinery
 import importlib.resources
 from collections import defaultdict
 from types import ModuleType
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from ...core import importer
 from . import asset, types
 
 
+def _call(name: str, args: List[ast.expr], node: ast.AST) -> ast.Call:
+    # fresh nodes located at the rewritten one, sharing them across calls
+    # would leak the locations of the first module into the others
+    func = ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+    return ast.copy_location(ast.Call(func=func, args=args, keywords=[]), node)
+
+
 class Module(ModuleType):
     # pylint: disable=too-few-public-methods
     __package__: str
@@ -66,29 +73,29 @@ class Loader(importer.Loader):
 
     def visit_FormattedValue(self, node):
         self.generic_visit(node)
-        return ast.Call(
-            func=ast.Name(id="_fval", ctx=ast.Load()),
-            args=[
+        return _call(
+            "_fval",
+            [
                 node.value,
                 ast.Num(n=node.conversion),
                 node.format_spec or ast.NameConstant(value=None),
             ],
-            keywords=[],
+            node,
         )
 
     def visit_JoinedStr(self, node):
         self.generic_visit(node)
-        return ast.Call(
-            func=ast.Name(id="_fstr", ctx=ast.Load()),
-            args=[ast.List(elts=node.values, ctx=ast.Load())],
-            keywords=[],
-        )
+        return _call("_fstr", [ast.List(elts=node.values, ctx=ast.Load())], node)
 
     @staticmethod
     def visit_Str(node):
-        return ast.Call(
-            func=ast.Name(id="str", ctx=ast.Load()), args=[node], keywords=[]
-        )
+        return _call("str", [node], node)
+
+    def visit_Constant(self, node):
+        # Python 3.8+ parses string literals as constants
+        if isinstance(node.value, str):
+            return self.visit_Str(node)
+        return node
 
     def visit_FunctionDef(self, node):
         if self.in_def:
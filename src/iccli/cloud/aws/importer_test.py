@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
+import ast
 import importlib
 import importlib.resources
 import pathlib
@@ -37,13 +38,16 @@ def setup_function(func):
     else:
         raise NotImplementedError  # pragma: no cover
 
+    with importlib.resources.path(f"{testdata.__package__}.brick", suffix[1:]) as path:
+        brick = path
+    with importlib.resources.path(testdata.__package__, "index") as path:
+        index = path
+
     def resolve(parent: Optional[pathlib.Path], name: str) -> Optional[pathlib.Path]:
         if name.endswith("dummy"):
             raise LookupError
         if parent is None:
-            pkg = f"{testdata.__package__}.brick"
-            with importlib.resources.path(pkg, suffix[1:]) as path:
-                return path
+            return brick
         return parent.joinpath(name.rpartition(".")[-1])
 
     base_config.MODE.set(mode)
@@ -63,11 +67,8 @@ def setup_function(func):
             parent: Optional[pathlib.Path], name: str
         ) -> Optional[pathlib.Path]:
             dots = name.count(".")
-            pkg = f"{testdata.__package__}"
-            with importlib.resources.path(pkg, "index") as path:
-                root = path
             if parent is None and not dots:
-                return root
+                return index
             if dots == 0:
                 # if requesting something from index with only the
                 # username, then use namesapce packages
@@ -76,7 +77,7 @@ def setup_function(func):
                 # now we have both username and component name and we
                 # can proceed
                 parts = name.split(".")
-                return root / parts[0] / parts[1]
+                return index / parts[0] / parts[1]
             assert parent
             return parent.joinpath(name.rpartition(".")[-1])
 
@@ -86,6 +87,12 @@ def setup_function(func):
         sys.meta_path.insert(3, finder)
 
 
+def teardown_function(func):
+    # pylint: disable=unused-argument
+    finders = (base_importer.LibFinder, base_importer.Finder, rescs_importer.Finder)
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, finders)]
+
+
 IMPORT_ICP_INVALID_TESTS = map(
     lambda t: pytest.param(*t[1:], id=t[0]),
     [
@@ -264,3 +271,86 @@ def test_import_ic_def_valid():
 def test_import_ic_def_invalid():
     with pytest.raises(NotImplementedError, match="nested functions"):
         importlib.import_module("icm.visit.def_invalid")
+
+
+def test_import_ic_locations():
+    loader = importer.Loader()
+    for lineno in [1, 3]:
+        tree = ast.parse("\n" * (lineno - 1) + "x = f'{1}'")
+        tree = ast.fix_missing_locations(loader.visit(tree))
+        calls = [n for n in ast.walk(tree) if isinstance(n, ast.Call)]
+        assert calls
+        assert {n.func.lineno for n in calls} == {lineno}
+
+
+def test_import_ic_pycache(tmp_path, mocker):
+    base_config.PYCACHE.set(tmp_path)
+    mod = importlib.import_module("icm.something")
+    cached = sorted(tmp_path.iterdir())
+    assert cached
+    for name in [n for n in sys.modules if n.startswith("icm")]:
+        del sys.modules[name]
+    rewrite = mocker.spy(importer.Loader, "_rewrite")
+    assert importlib.import_module("icm.something").foo == mod.foo
+    assert rewrite.call_count == 0
+    assert sorted(tmp_path.iterdir()) == cached
+
+
+def test_import_ic_pycache_unavailable(tmp_path, mocker):
+    # the loader sources cannot be read, like from a zipapp
+    base_config.PYCACHE.set(tmp_path / "cache")
+    mocker.patch.object(importer, "__file__", str(tmp_path / "app.zip" / "x.py"))
+    base_importer._fingerprint.cache_clear()  # pylint: disable=protected-access
+    assert importlib.import_module("icm.something").foo == "bar"
+    assert not (tmp_path / "cache").exists()
+
+
+def test_import_ic_pycache_prune(tmp_path):
+    base_config.PYCACHE.set(tmp_path)
+    loader = importer.Loader()
+    loader._code(b"x = 1\n", "a.ic")  # pylint: disable=protected-access
+    loader._code(b"x = 1\n", "b.ic")  # pylint: disable=protected-access
+    code = loader._code(b"x = 2\n", "a.ic")  # pylint: disable=protected-access
+    names = {p.name.partition(".")[0] for p in tmp_path.iterdir()}
+    assert len(names) == len(list(tmp_path.iterdir())) == 2
+    scope: dict = {}
+    exec(code, scope)  # pylint: disable=exec-used
+    assert scope["x"] == 2
+
+
+def test_import_ic_preload(tmp_path, mocker):
+    base_config.PYCACHE.set(tmp_path)
+    with importlib.resources.path(f"{testdata.__package__}.brick", "ic") as path:
+        importer.Loader.preload(path, ".ic")
+    assert len(list(tmp_path.iterdir())) >= base_importer.PRELOAD_MIN
+    rewrite = mocker.spy(importer.Loader, "_rewrite")
+    assert importlib.import_module("icm.something").foo == "bar"
+    assert rewrite.call_count == 0
+
+
+def test_import_ic_preload_importable(tmp_path, mocker):
+    base_config.PYCACHE.set(tmp_path / "cache")
+    for name in [
+        ".git/a.ic",
+        "node_modules/b.ic",
+        "__pycache__/c.ic",
+        "d-e/f.ic",
+        "g-h.ic",
+        "i.icp",
+    ]:
+        path = tmp_path / "src" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+    cache_path = mocker.spy(importer.Loader, "_cache_path")
+    importer.Loader.preload(tmp_path / "src", ".ic")
+    assert cache_path.call_count == 0
+
+
+def test_import_ic_preload_hash_once(tmp_path, mocker):
+    base_config.PYCACHE.set(tmp_path)
+    cache_path = mocker.spy(importer.Loader, "_cache_path")
+    with importlib.resources.path(f"{testdata.__package__}.brick", "ic") as path:
+        importer.Loader.preload(path, ".ic")
+        count = cache_path.call_count
+        assert importlib.import_module("icm.something").foo == "bar"
+    assert cache_path.call_count == count
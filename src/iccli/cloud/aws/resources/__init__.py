@@ -20,11 +20,11 @@ import inspect
 import json
 import numbers
 import re
+import sys
 from collections import defaultdict
-from contextlib import suppress
-from copy import deepcopy
 from datetime import date, datetime
-from functools import lru_cache, partial, reduce
+from functools import lru_cache, partial
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
@@ -46,14 +46,57 @@ from mypy_extensions import KwArg, VarArg
 from ....core import resource as base
 from .. import types
 
-TRANS: Mapping[str, str] = json.loads(
-    importlib.resources.read_text(__package__, "trans.json")
-)
+
+@lru_cache(maxsize=None)
+def _trans() -> Mapping[str, str]:
+    # deferred until the first `load` as this module is imported on startup
+    trans = json.loads(importlib.resources.read_binary(__package__, "trans.json"))
+    # the names end up as keys of every checker and factory
+    return {sys.intern(k): sys.intern(v) for k, v in trans.items()}
+
+
+class _FrozenList(tuple):
+    """A list of the properties, read-only."""
+
+    __slots__ = ()
+
+
+def _freeze(val: Any) -> Any:
+    if isinstance(val, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in val.items()})
+    if isinstance(val, list):
+        return _FrozenList(_freeze(v) for v in val)
+    return val
+
+
+def _thaw(val: Any) -> Any:
+    # a plain copy, also of the (partly) frozen properties given back
+    if isinstance(val, (dict, MappingProxyType)):
+        return {k: _thaw(v) for k, v in val.items()}
+    if isinstance(val, (list, _FrozenList)):
+        return [_thaw(v) for v in val]
+    return val
 
 
 class Resource(base.Resource):
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = (
+        "_vnd",
+        "_svc",
+        "_com",
+        "_type",
+        "_attrs",
+        "_check",
+        "_rev",
+        "_rendered",
+        "_raw_props",
+        "_frozen_props",
+        "_props",
+        "_reqs",
+        "_deletion",
+    )
+
     def __init__(
         self,
         name: str,
@@ -72,7 +115,10 @@ class Resource(base.Resource):
         self._type = typ  # AWS::CloudFormation::WaitConditionHandle
         self._attrs = {k: v(self.id) for k, v in attrs.items()}
         self._check = check
+        self._rev = 0  # bumped on every change, see `encode._render`
+        self._rendered = cast(Optional[Tuple[int, Mapping[str, Any]]], None)
         self._raw_props = cast(Mapping[str, Any], {})
+        self._frozen_props = cast(Optional[Mapping[str, Any]], None)
         self._props = cast(Mapping[str, Any], {})
         self.props = props
         self._reqs = cast(List[base.Resource], [])
@@ -91,18 +137,30 @@ class Resource(base.Resource):
 
     @property
     def props(self) -> Mapping[str, Any]:
-        return deepcopy(self._raw_props)
+        """A read-only copy of the properties, built once per assignment.
+
+        Nested dicts and lists are read-only too, assign new properties to
+        change them.
+
+        """
+        if self._frozen_props is None:
+            self._frozen_props = _freeze(self._raw_props)
+        return self._frozen_props
 
     @props.setter
     def props(self, val: Mapping[str, Any]):
         try:
+            val = _thaw(val)
             self._props = self._check(val)
             self._raw_props = val
+            self._frozen_props = None
+            self._rev += 1
         except Exception as exc:
             raise TypeError(f"{'.'.join(self.lineage)}: {str(exc)}") from None
 
     def require(self, *deps: "Resource"):
         self._reqs.extend(deps)
+        self._rev += 1
 
     def deletion(self, policy: str):
         policies = {"delete", "retain", "snapshot"}
@@ -111,56 +169,143 @@ class Resource(base.Resource):
                 f"invalid deletion policy {policy!r}, expected one of {policies}"
             )
         self._deletion = policy
+        self._rev += 1
 
     # python/myp#220
     deletion = property(fset=deletion)  # type: ignore
 
 
-Spec = Mapping[str, Mapping[str, Mapping[str, Callable[[VarArg(), KwArg()], Resource]]]]
+class _ResourceFactory:
+    # pylint: disable=too-few-public-methods,too-many-arguments
+
+    __slots__ = (
+        "vnd",
+        "svc",
+        "com",
+        "typ",
+        "attrs",
+        "check",
+        "__name__",
+        "__qualname__",
+        "__signature__",
+    )
+
+    def __init__(
+        self,
+        vnd: str,
+        svc: str,
+        com: str,
+        typ: str,
+        attrs: Mapping[str, Union[Type[types.Ref], Type[types.Attr]]],
+        check: "ObjectChecker",
+    ):
+        self.vnd = vnd
+        self.svc = svc
+        self.com = com
+        self.typ = typ
+        self.attrs = attrs
+        self.check = check
+        self.__name__ = com
+        self.__qualname__ = com
+        self.__signature__ = inspect.Signature(
+            [inspect.Parameter(p, inspect.Parameter.KEYWORD_ONLY) for p in check.items]
+        )
+
+    def __call__(self, *args, **kwargs) -> Resource:
+        name = args[0] if args else ""
+        return Resource(
+            name, self.vnd, self.svc, self.com, self.typ, self.attrs, self.check, kwargs
+        )
+
+    def __repr__(self) -> str:
+        return f"<resource factory {self.vnd}.{self.svc}.{self.com}>"
+
+
+Factory = Callable[[VarArg(), KwArg()], Resource]
+Spec = Mapping[str, Mapping[str, Mapping[str, Factory]]]
+
+
+class _Factories(Mapping[str, Factory]):
+    """The resource factories of a service, baked on first access."""
+
+    # pylint: disable=too-many-arguments
+
+    def __init__(
+        self,
+        vnd: str,
+        svc: str,
+        typs: Mapping[str, str],
+        specs: Mapping[str, Any],
+        ptyps: Mapping[str, Mapping[str, Any]],
+    ):
+        self._vnd = vnd
+        self._svc = svc
+        self._typs = typs  # com -> AWS::Service::Component
+        self._specs = specs
+        self._ptyps = ptyps
+        self._rescs: Dict[str, Factory] = {}
+
+    def __getitem__(self, com: str) -> Factory:
+        resc = self._rescs.get(com)
+        if resc is None:
+            resc = self._rescs[com] = self._bake(com)
+        return resc
+
+    def __contains__(self, com: object) -> bool:
+        return com in self._typs
+
+    def __iter__(self):
+        return iter(self._typs)
+
+    def __len__(self) -> int:
+        return len(self._typs)
+
+    def _bake(self, com: str) -> Factory:
+        typ = self._typs[com]
+        spec = self._specs["ResourceTypes"][typ]
+        trans = _trans()
+        attrs: MutableMapping[str, Union[Type[types.Ref], Type[types.Attr]]] = {
+            trans[a]: _resolve_attr(
+                a, s.get("PrimitiveType"), s.get("Type"), s.get("PrimitiveItemType")
+            )
+            for a, s in spec.get("Attributes", {}).items()
+        }
+        attrs["ref"] = types.Ref
+        # most types are identical across regions, share their checkers
+        group = self._ptyps.get(typ, {})
+        glbs = self._ptyps.get("", {})
+        data = (spec, group, {r: glbs[r] for r in _refs(typ, spec, group, glbs)})
+        for odata, check in _CHECKERS[typ]:
+            if odata == data:
+                break
+        else:
+            check = _resolve_check(typ, spec, self._specs)
+            _CHECKERS[typ].append((data, check))
+        return _ResourceFactory(self._vnd, self._svc, com, typ, attrs, check)
 
 
 @lru_cache(maxsize=None)
 def load(region: str) -> Spec:
-    specs = json.loads(importlib.resources.read_text(__package__, f"{region}.json"))
-    rescs: MutableMapping[
-        str,
-        MutableMapping[
-            str, MutableMapping[str, Callable[[VarArg(), KwArg()], Resource]]
-        ],
-    ] = {}
-    for typ, spec in specs["ResourceTypes"].items():
+    specs = json.loads(importlib.resources.read_binary(__package__, f"{region}.json"))
+    # property types are only ever looked up under their resource type or
+    # globally (e.g. `Tag`), see `_resolve_check`
+    ptyps: MutableMapping[str, MutableMapping[str, Any]] = defaultdict(dict)
+    for ptyp, pspec in specs["PropertyTypes"].items():
+        head, sep, _ = ptyp.partition(".")
+        ptyps[head if sep else ""][ptyp] = pspec
+    trans = _trans()
+    index: MutableMapping[str, MutableMapping[str, MutableMapping[str, str]]] = {}
+    for typ in specs["ResourceTypes"]:
         rvnd, rsvc, rcom = typ.split("::")
-        vnd, svc, com = TRANS[rvnd], TRANS[rsvc], TRANS[rcom]
+        vnd, svc, com = trans[rvnd], trans[rsvc], trans[rcom]
         svc = "lambda_" if svc == "lambda" else svc
-        attrs: MutableMapping[str, Union[Type[types.Ref], Type[types.Attr]]] = {
-            TRANS[a]: _resolve_attr(a, s) for a, s in spec.get("Attributes", {}).items()
+        index.setdefault(vnd, {}).setdefault(svc, {})[com] = typ
+    return {
+        vnd: {
+            svc: _Factories(vnd, svc, typs, specs, ptyps) for svc, typs in svcs.items()
         }
-        attrs["ref"] = types.Ref
-        check = _resolve_check(typ, spec, specs)
-
-        def bake(vnd_, svc_, com_, typ_, attrs_, check_):
-            def factory(*args, **kwargs) -> Resource:
-                name = next(iter(args), "")
-                # props = dict(kwargs) if kwargs else None
-                res = Resource(
-                    name, vnd_, svc_, com_, typ_, attrs_, check_, dict(kwargs)
-                )
-                return res
-
-            factory.__module__ = ".".join(["ic", vnd_, svc_])
-            factory.__name__ = com_
-            factory.__qualname__ = com_
-            sigs = [
-                inspect.Parameter(p, inspect.Parameter.KEYWORD_ONLY)
-                for p in check_.items
-            ]
-            # python/myp#5958
-            factory.__signature__ = inspect.Signature(sigs)  # type: ignore
-            return factory
-
-        resc = bake(vnd, svc, com, typ, attrs, check)
-        rescs.setdefault(vnd, {}).setdefault(svc, {})[com] = resc
-    return rescs
+        for vnd, svcs in index.items()
+    }
 
 
 TYPES = {
@@ -172,11 +317,28 @@ TYPES = {
 }
 
 
-def _resolve_attr(name: str, spec) -> Type[types.Attr]:
-    ptrs = ("PrimitiveType", "Type", "PrimitiveItemType")
-    raws = [spec.get(t) for t in ptrs]
+_CHECKERS: MutableMapping[
+    str, List[Tuple[Any, Callable[[Any], NoReturn]]]
+] = defaultdict(list)
+
+
+def _refs(typ: str, spec, group, glbs) -> Set[str]:
+    """Returns the global property types (e.g. `Tag`) used by a resource type."""
+    refs: Set[str] = set()
+    for sspec in (spec, *group.values()):
+        for pspec in (sspec, *sspec.get("Properties", {}).values()):
+            for ref in (pspec.get("Type"), pspec.get("ItemType")):
+                if ref in glbs and f"{typ}.{ref}" not in group:
+                    refs.add(ref)
+    return refs
+
+
+@lru_cache(maxsize=None)
+def _resolve_attr(name: str, *raws: Optional[str]) -> Type[types.Attr]:
     typs = [TYPES[t] for t in raws if t is not None]
-    typ = reduce(lambda sub, par: par[sub], reversed(typs))  # type: ignore
+    typ = typs[-1]
+    for par in typs[-2::-1]:
+        typ = par[typ]  # type: ignore
     return types.Attr[typ, name]  # type: ignore
 
 
@@ -185,12 +347,34 @@ def _check_any(val: Any):
 
 
 def _check_type(typs: Tuple[Type, ...], val: Any):
-    if val is None:
-        return None
-    if not isinstance(val, typs):
-        exp = " or ".join([repr(t.__name__) for t in typs])
+    if val is None or isinstance(val, typs):
+        return val
+    exp = " or ".join([repr(t.__name__) for t in typs])
+    raise TypeError(f"incompatible type {type(val).__name__!r}, expected {exp}")
+
+
+def _type_check(*typs: Type) -> Callable[[Any], Any]:
+    """Same as `_check_type` but with the error message baked once."""
+    exp = " or ".join([repr(t.__name__) for t in typs])
+    # subclasses are redundant for `isinstance` (e.g. `datetime` of `date`)
+    typs = tuple(
+        t for t in typs if not any(t is not o and issubclass(t, o) for o in typs)
+    )
+
+    def check(val: Any):
+        if val is None or isinstance(val, typs):
+            return val
         raise TypeError(f"incompatible type {type(val).__name__!r}, expected {exp}")
-    return val
+
+    return check
+
+
+_check_bool = _type_check(bool, types.Bool)
+_check_date = _type_check(date, datetime)
+_check_dict = _type_check(dict)
+_check_num = _type_check(numbers.Number, types.Int)
+_check_seq = _type_check(list, types.List)
+_check_str = _type_check(str, types.Str)
 
 
 def _check_number(val: Any):
@@ -198,16 +382,19 @@ def _check_number(val: Any):
         return None
     valf = val
     if isinstance(val, str):
-        with suppress(ValueError):
+        # a bare try is much cheaper than `contextlib.suppress` here
+        try:
             valf = float(val)
-    _check_type((numbers.Number, types.Int), valf)
+        except ValueError:
+            pass
+    _check_num(valf)
     return val
 
 
 def _check_timestamp(val: Any):
     if val is None:
         return None
-    _check_type((date, datetime), val)
+    _check_date(val)
     if val.tzinfo is None:
         raise TypeError("missing timezone information")
     return val
@@ -216,24 +403,33 @@ def _check_timestamp(val: Any):
 def _check_list(items: Callable[[Any], NoReturn], val: Any):
     if val is None:
         return None
-    _check_type((list, types.List), val)
+    _check_seq(val)
     if isinstance(val, types.Opaque):
         return val
     res: Any = []
-    if not isinstance(val, types.Opaque):
-        for i, item in enumerate(val):
-            if item is not None:
-                try:
-                    res.append(items(item))
-                except Exception as exc:
-                    raise TypeError(f"[{i}]: {str(exc)}") from None
+    for i, item in enumerate(val):
+        if item is not None:
+            try:
+                res.append(items(item))
+            except Exception as exc:
+                raise TypeError(f"[{i}]: {str(exc)}") from None
     return res
 
 
+def _check_list_any(val: Any):
+    """Same as `_check_list` with `_check_any` items, without the calls."""
+    if val is None:
+        return None
+    _check_seq(val)
+    if isinstance(val, types.Opaque):
+        return val
+    return [item for item in val if item is not None]
+
+
 def _check_map(items: Callable[[Any], NoReturn], val: Any) -> Any:
     if val is None:
         return None
-    _check_type((dict,), val)
+    _check_dict(val)
     res: Any = {}
     for prop, item in val.items():
         if item is not None:
@@ -244,90 +440,137 @@ def _check_map(items: Callable[[Any], NoReturn], val: Any) -> Any:
     return res
 
 
+def _check_map_any(val: Any) -> Any:
+    """Same as `_check_map` with `_check_any` items, without the calls."""
+    if val is None:
+        return None
+    _check_dict(val)
+    return {prop: item for prop, item in val.items() if item is not None}
+
+
 class ObjectChecker:
     # pylint: disable=too-few-public-methods
 
-    items: Dict[str, Callable[[Any], NoReturn]]
-    reqs: Set[str]
-    trans: Mapping[str, str]
+    __slots__ = (
+        "items",
+        "reqs",
+        "trans",
+        "custom",
+        "_items_keys",
+        "_reqs",
+        "_combined",
+    )
 
-    def __init__(self, custom: bool = False):
+    def __init__(
+        self,
+        items: Dict[str, Callable[[Any], NoReturn]],
+        reqs: Set[str],
+        trans: Mapping[str, str],
+        custom: bool = False,
+    ):
+        self.items = items
+        self.reqs = reqs
+        self.trans = trans
         self.custom = custom
+        # `items` may still be filled in by a recursive `_resolve_check`
+        # but its keys are always those of `trans`
+        self._items_keys = frozenset(trans)
+        self._reqs = frozenset(reqs)
+        # key -> (translated key, check), built once `items` is complete
+        self._combined = cast(
+            Optional[Mapping[str, Tuple[str, Callable[[Any], NoReturn]]]], None
+        )
 
     def __call__(self, val: Any) -> Any:
         if val is None:
             val = {}
         else:
             _check_type((dict,), val)
-        extra = set(val.keys()) - set(self.items.keys())
+        extra = val.keys() - self._items_keys
         if extra and not self.custom:
             raise TypeError(f"got unexpected keys: {extra!r}")
-        missing = self.reqs - {k for k, v in val.items() if v is not None}
-        if missing:
-            raise TypeError(f"missing required keys: {missing!r}")
+        if self._reqs:
+            missing = self._reqs.difference(k for k, v in val.items() if v is not None)
+            if missing:
+                raise TypeError(f"missing required keys: {set(missing)!r}")
+        combined = self._combined
+        if combined is None:
+            combined = self._combined = {
+                k: (self.trans[k], v) for k, v in self.items.items()
+            }
         res: Any = {}
         for prop, item in val.items():
             if item is not None:
                 try:
-                    if prop in extra:
+                    entry = combined.get(prop)
+                    if entry is None:
                         if not re.fullmatch(r"[a-z0-9_]+", prop):
                             raise TypeError(
                                 f"got malformed key, expected [a-z0-9_]+: {prop!r}"
                             )
                         res[prop] = item
                     else:
-                        res[self.trans[prop]] = self.items[prop](item)
+                        res[entry[0]] = entry[1](item)
                 except Exception as exc:
                     raise TypeError(f"{prop}: {str(exc)}") from None
         return res
 
 
 CHECKS: Mapping[str, Callable] = {
-    "Boolean": partial(_check_type, (bool, types.Bool)),
+    "Boolean": _check_bool,
     "Double": _check_number,
     "Integer": _check_number,
     "Json": _check_any,
     "List": _check_list,
     "Long": _check_number,
     "Map": _check_map,
-    "String": partial(_check_type, (str, types.Str)),
+    "String": _check_str,
     "Timestamp": _check_timestamp,
 }
 
 
+@lru_cache(maxsize=None)
+def _check_items(typ: str, check: Callable[[Any], Any]) -> Callable[[Any], NoReturn]:
+    if check is _check_any:
+        return {"List": _check_list_any, "Map": _check_map_any}[typ]
+    return partial(CHECKS[typ], check)
+
+
 def _resolve_check(name: str, spec, specs, cache=None) -> Callable[[Any], NoReturn]:
     com = name.split(".")[0]
     cache = cache or {}
-    key = f"{com}.{name}"
+    key = sys.intern(f"{com}.{name}")
     if key in cache:
         return cache[key]
     if "PrimitiveType" in spec:
         cache[key] = CHECKS[spec["PrimitiveType"]]
     elif "PrimitiveItemType" in spec:
         check = CHECKS[spec["PrimitiveItemType"]]
-        cache[key] = partial(CHECKS[spec["Type"]], check)
+        cache[key] = _check_items(spec["Type"], check)
     elif "Properties" in spec:
-        cache[key] = ObjectChecker(name == "AWS::CloudFormation::CustomResource")
-        cache[key].items = {
-            TRANS[prop]: _resolve_check(f"{com}.{prop}", sspec, specs, cache)
-            for prop, sspec in spec["Properties"].items()
-        }
-        cache[key].reqs = {
-            TRANS[prop]
-            for prop, sspec in spec["Properties"].items()
-            if sspec["Required"]
-        }
-        cache[key].trans = {TRANS[prop]: prop for prop in spec["Properties"]}
+        props = spec["Properties"]
+        trans = _trans()
+        items: Dict[str, Callable[[Any], NoReturn]] = {}
+        cache[key] = ObjectChecker(
+            items,
+            {trans[prop] for prop, sspec in props.items() if sspec["Required"]},
+            {trans[prop]: prop for prop in props},
+            name == "AWS::CloudFormation::CustomResource",
+        )
+        items.update(
+            (trans[prop], _resolve_check(f"{com}.{prop}", sspec, specs, cache))
+            for prop, sspec in props.items()
+        )
     else:
         typ = spec.get("ItemType") or spec["Type"]
         typs = specs["PropertyTypes"]
-        skey = f"{com}.{typ}"
+        skey = sys.intern(f"{com}.{typ}")
         sspec = typs.get(skey) or typs[typ]
         check = cache.get(skey)
         if not check:
             check = _resolve_check(f"{com}.{name}", sspec, specs, cache)
         if "ItemType" in spec:
-            cache[key] = partial(CHECKS[spec["Type"]], check)
+            cache[key] = _check_items(spec["Type"], check)
         elif "Type" in spec:
             cache[key] = check
         else:
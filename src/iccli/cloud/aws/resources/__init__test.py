@@ -25,7 +25,9 @@ from . import (
     ObjectChecker,
     _check_any,
     _check_list,
+    _check_list_any,
     _check_map,
+    _check_map_any,
     _check_number,
     _check_timestamp,
     _check_type,
@@ -103,8 +105,10 @@ def test_load(val: str):
     assert wch.id == "u6pzt3h2"
 
     wch.props = {}
-    wch.props["foo"] = "bar"  # type: ignore
+    with pytest.raises(TypeError):
+        wch.props["foo"] = "bar"  # type: ignore
     assert wch.props == {}
+    wch.props = wch.props
 
     with pytest.raises(TypeError, match="got unexpected keys: {'foo'}"):
         wch.props = {"foo": "bar"}
@@ -120,6 +124,21 @@ def test_load(val: str):
     wch.require(wch)
     assert wch in wch._reqs
 
+    tags = [dict(key="k", value="v")]
+    bkt = bucket("bkt", tags=tags)
+    rev = bkt._rev
+    tags.append(dict(foo="bar"))
+    with pytest.raises(AttributeError):
+        bkt.props["tags"].append(dict(foo="bar"))  # type: ignore
+    with pytest.raises(TypeError):
+        bkt.props["tags"][0]["key"] = "x"  # type: ignore
+    assert bkt.props == dict(tags=(dict(key="k", value="v"),))
+    assert bkt._props == dict(Tags=[dict(Key="k", Value="v")])
+    assert bkt._rev == rev
+    bkt.props = bkt.props
+    bkt.props = dict(bkt.props, tags=[*bkt.props["tags"], dict(key="x", value="y")])
+    assert len(bkt._props["Tags"]) == 2 and bkt._rev == rev + 2
+
 
 CHECK_NONE_TESTS = map(
     lambda t: pytest.param(*t[1:], id=t[0]),
@@ -130,6 +149,8 @@ CHECK_NONE_TESTS = map(
         ("timestamp", _check_timestamp),
         ("list", partial(_check_list, _check_any)),
         ("map", partial(_check_map, _check_any)),
+        ("list_any", _check_list_any),
+        ("map_any", _check_map_any),
     ],
 )
 
@@ -149,6 +170,9 @@ CHECK_VAL_TESTS = map(
         ("list", partial(_check_list, _check_any), [42]),
         ("list", partial(_check_list, _check_any), types.List()),
         ("map", partial(_check_map, _check_any), {"foo": "bar"}),
+        ("list_any", _check_list_any, [42]),
+        ("list_any", _check_list_any, types.List()),
+        ("map_any", _check_map_any, {"foo": "bar"}),
     ],
 )
 
@@ -159,9 +183,7 @@ def test_check_val(func, val):
 
 
 def test_check_object_none():
-    check = ObjectChecker()
-    check.reqs = set()
-    check.items = dict()
+    check = ObjectChecker(dict(), set(), dict())
     check(None)
 
 
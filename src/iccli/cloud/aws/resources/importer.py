@@ -31,25 +31,20 @@ class Finder(importlib.abc.MetaPathFinder):
         name: str, path: Optional[Sequence[Union[bytes, str]]], target=None
     ) -> Optional[importlib.machinery.ModuleSpec]:
         # pylint: disable=unused-argument
-        if base_config.MODE.get() == base_config.Mode.ICP:
+        if not name.startswith("icl"):  # most imports, keep it cheap
             return None
-        if name == "icl":
+        parts = name.split(".", 3)  # icl[.vendor[.service[.rest]]]
+        if parts[0] != "icl" or base_config.MODE.get() == base_config.Mode.ICP:
+            return None
+        if len(parts) == 1:
             return importlib.util.spec_from_loader(name, None, is_package=True)
-        spec = load(config.REGION.get())
-        prefixes = tuple(f"icl.{x}" for x in spec)
-        if name in prefixes:
-            vnd = spec[name.rpartition(".")[-1]]
-            return importlib.util.spec_from_loader(name, Loader(vnd), is_package=True)
-        for prefix in prefixes:
-            if name.startswith(prefix):
-                svcs = spec[prefix.rpartition(".")[-1]]
-                postfix = name[len(f"{prefix}.") :]
-                break
-        else:
+        svcs = load(config.REGION.get()).get(parts[1])
+        if svcs is None:
             return None
-        parts = postfix.split(".")
-        if len(parts) == 1 and parts[0] in svcs:
-            svc = svcs[parts[0]]
+        if len(parts) == 2:
+            return importlib.util.spec_from_loader(name, Loader(svcs), is_package=True)
+        if len(parts) == 3 and parts[2] in svcs:
+            svc = svcs[parts[2]]
             return importlib.util.spec_from_loader(name, Loader(svc), is_package=False)
         return None
 
@@ -59,12 +54,13 @@ class Loader(importlib.abc.Loader):
 
     def __init__(self, exports):
         self.exports = exports
+        self._all = list(exports)
 
     def create_module(self, spec):
         ...
 
     def exec_module(self, module):
-        vars(module)["__all__"] = list(self.exports.keys())
+        vars(module)["__all__"] = self._all
         if not hasattr(module, "__path__"):
             vars(module).update(self.exports)
         else:
@@ -26,11 +26,21 @@ from .. import config
 from . import importer, load
 
 
+def setup_function(func):
+    # pylint: disable=unused-argument
+    sys.meta_path.insert(0, base_importer.LibFinder())
+    sys.meta_path.insert(1, importer.Finder())
+
+
+def teardown_function(func):
+    # pylint: disable=unused-argument
+    finders = (base_importer.LibFinder, importer.Finder)
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, finders)]
+
+
 def test_import():
     base_config.MODE.set(base_config.Mode.IC)
     config.REGION.set("us-east-1")
-    sys.meta_path.insert(0, base_importer.LibFinder())
-    sys.meta_path.insert(1, importer.Finder())
 
     spec = load(config.REGION.get())
     for vnd in spec:
@@ -37,6 +37,7 @@ See https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cfn-resource-
 import json
 import re
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 URL = "https://{dist}.cloudfront.net/latest/CloudFormationResourceSpecification.json"
 REFS = {
@@ -67,61 +68,64 @@ def patch(spec):
     key = "AWS::SSM::Association.ParameterValues"
     if key in props:
         old = props[key]
-        props[key] = dict(
-            **{
-                k: v
-                for k, v in old["Properties"]["ParameterValues"].items()
-                if k not in ("Documentation", "Required")
-            },
-            Documentation=old["Documentation"],
-        )
+        new = props[key] = old["Properties"]["ParameterValues"]
+        new.pop("Documentation", None)
+        new.pop("Required", None)
+        new["Documentation"] = old["Documentation"]
 
     key = "AWS::ServiceDiscovery::Instance"
     if key in rescs:
-        old = rescs[key]
-        rescs[key]["Properties"]["InstanceAttributes"] = dict(
-            **{
-                k: v
-                for k, v in old["Properties"]["InstanceAttributes"].items()
-                if k not in ("PrimitiveType",)
-            },
-            Type="Map",
-            PrimitiveItemType="String",
-        )
+        attrs = rescs[key]["Properties"]["InstanceAttributes"]
+        attrs.pop("PrimitiveType", None)
+        attrs["Type"] = "Map"
+        attrs["PrimitiveItemType"] = "String"
+
+
+CAMEL_WORD = re.compile(r"(.)([A-Z][a-z]+)")
+CAMEL_CASE = re.compile(r"([a-z0-9])([A-Z])")
 
 
 def camel_to_snake(name):
-    sub = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name.replace(".", ""))
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", sub).lower()
+    name = name.replace(".", "")
+    if name.islower():  # nothing to split on
+        return name
+    sub = CAMEL_WORD.sub(r"\1_\2", name)
+    return CAMEL_CASE.sub(r"\1_\2", sub).lower()
 
 
 def translate(spec, trans):
+    names = set()
     for name, types in spec["ResourceTypes"].items():
-        vnd, svc, com = name.split("::")
-        trans.setdefault(vnd, camel_to_snake(vnd))
-        trans.setdefault(svc, camel_to_snake(svc))
-        trans.setdefault(com, camel_to_snake(com))
-        for attr in types.get("Attributes", {}):
-            trans.setdefault(attr, camel_to_snake(attr))
-        for prop in types.get("Properties", {}):
-            trans.setdefault(prop, camel_to_snake(prop))
+        vnd, _, rest = name.partition("::")
+        svc, _, com = rest.partition("::")
+        names.update((vnd, svc, com))
+        names.update(types.get("Attributes", {}))
+        names.update(types.get("Properties", {}))
     for name, types in spec["PropertyTypes"].items():
-        for prop in types.get("Properties", {}):
-            trans.setdefault(prop, camel_to_snake(prop))
+        names.update(types.get("Properties", {}))
+    # regions mostly share their names, only translate the new ones
+    trans.update({n: camel_to_snake(n) for n in names - trans.keys()})
+
+
+def fetch(dist):
+    with urllib.request.urlopen(URL.format(dist=dist)) as resp:
+        return json.loads(resp.read())  # bytes are decoded by the parser
 
 
 def update():
     with open("trans.json") as file:
         trans = json.loads(file.read())
 
-    for dist, reg in REFS.items():
-        print(f"updating {reg}")
-        url = URL.format(dist=dist)
-        spec = json.loads(urllib.request.urlopen(url).read().decode())
-        patch(spec)
-        translate(spec, trans)
-        with open(f"{reg}.json", "w") as file:
-            file.write(json.dumps(spec))
+    # downloads are network bound, fetch all the regions concurrently and
+    # process them in order as they arrive
+    with ThreadPoolExecutor(max_workers=len(REFS)) as pool:
+        for reg, spec in zip(REFS.values(), pool.map(fetch, REFS)):
+            print(f"updating {reg}")
+            patch(spec)
+            translate(spec, trans)
+            with open(f"{reg}.json", "w") as file:
+                # specs are only read back by the loader, skip the padding
+                json.dump(spec, file, separators=(",", ":"))
 
     with open("trans.json", "w") as file:
         file.write(json.dumps(trans, indent=2, sort_keys=True))
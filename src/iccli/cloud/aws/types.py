@@ -69,11 +69,14 @@
 #   Agreement.
 
 import string
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Mapping, Tuple, Type, Union
 
 # pylint: disable=too-few-public-methods
 # pylint: disable=no-self-use
 
+_FORMATTER = string.Formatter()  # stateless, shared by all the format calls
+
 
 class Opaque:
     """Base class for all types that are only available at provision
@@ -84,19 +87,27 @@ class Opaque:
 
     """
 
+    __slots__ = ()
+
     def __bool__(self):
         raise TypeError("opaque: undefined truth value")
 
 
+# bound once, `(str, Opaque)` in a function body builds the tuple per call
+_STR_OR_OPAQUE = (str, Opaque)
+
+
 class Bool(Opaque):
-    ...
+    __slots__ = ()
 
 
 class Int(Opaque):
-    ...
+    __slots__ = ()
 
 
 class Str(Opaque):
+    __slots__ = ()
+
     def split(self, sep: str = ""):
         return Split(sep, self)
 
@@ -106,49 +117,66 @@ class Str(Opaque):
         return Join(new, self.split(old))
 
     def __add__(self, other):
-        if not isinstance(other, (str, Opaque)):
+        if not isinstance(other, _STR_OR_OPAQUE):
             return NotImplemented
         return BridgeStr("").join([self, other])
 
 
 class List(Opaque):
+    __slots__ = ()
+
     select: Type["Select"]
 
+    @classmethod
+    @lru_cache(maxsize=None)  # one class per subscript
     def __class_getitem__(cls, item: Type[Opaque]) -> Type["List"]:
-        return type(List.__name__, (List,), dict(select=Select[item]))  # type: ignore
+        body = dict(__slots__=(), select=Select[item])  # type: ignore
+        return type(List.__name__, (List,), body)
 
     def __getitem__(self, item: int) -> "Select":
         return self.select(item, self)
 
 
 class Attr(Opaque):
+    # no slots, combined with the subscripted type whose slots would conflict
+
     name: str
 
+    @classmethod
+    @lru_cache(maxsize=None)  # one class per subscript
     def __class_getitem__(
         cls, item: Tuple[Type[Opaque], str]
     ) -> Union[Type["Attr"], Type[Opaque]]:
-        return type(Attr.__name__, (Attr, item[0]), dict(name=item[1]))
+        return type(Attr.__name__, (Attr, item[0]), dict(__slots__=(), name=item[1]))
 
     def __init__(self, rid: str):
         self.rid = rid
 
 
 class Join(Str):
+    __slots__ = ("delim", "args")
+
     def __init__(self, delim: str, args: Union[List, Iterable[Union[Str, str]]]):
         self.delim = delim
         self.args = args
 
 
 class Ref(Str):
+    __slots__ = ("rid",)
+
     def __init__(self, rid: str):
         self.rid = rid
 
 
 class Select(Opaque):
+    # no slots, combined with the subscripted type whose slots would conflict
+
+    @classmethod
+    @lru_cache(maxsize=None)  # one class per subscript
     def __class_getitem__(
         cls, item: Type[Opaque]
     ) -> Union[Type["Select"], Type[Opaque]]:
-        return type(Select.__name__, (Select, item), {})
+        return type(Select.__name__, (Select, item), dict(__slots__=()))
 
     def __init__(self, item: int, args: List):
         if not isinstance(item, int):
@@ -158,6 +186,8 @@ class Select(Opaque):
 
 
 class Sensitive(Str):
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: Any):
         if not isinstance(value, str):
             raise TypeError(f"sensitive: expected 'str' got {type(value).__name__!r}")
@@ -166,28 +196,38 @@ class Sensitive(Str):
 
 
 class Split(List[Str]):  # type: ignore
+    __slots__ = ("sep", "arg")
+
     def __init__(self, sep: str, arg: Str):
         self.sep = sep
         self.arg = arg
 
 
 class Sub(Str):
+    __slots__ = ("fmt", "args")
+
     def __init__(self, fmt: str, args: Mapping[str, Opaque]):
         self.fmt = fmt
         self.args = args
 
 
 class AvailabilityZones(List[Str]):  # type: ignore
+    __slots__ = ("region",)
+
     def __init__(self, region: str = None):
         self.region = region or Region()
 
 
 class Base64Encode(Str):
+    __slots__ = ("arg",)
+
     def __init__(self, arg: Opaque):
         self.arg = arg
 
 
 class CIDR(List[Str]):  # type: ignore
+    __slots__ = ("block", "count", "bits")
+
     def __init__(self, block: Opaque, count: int, bits: int):
         self.block = block
         self.count = count
@@ -195,70 +235,51 @@ class CIDR(List[Str]):  # type: ignore
 
 
 class AccountID(Str):
-    ...
+    __slots__ = ()
 
 
 class NotificationARNs(List[Str]):  # type: ignore
-    ...
+    __slots__ = ()
 
 
 class Partition(Str):
-    ...
+    __slots__ = ()
 
 
 class Region(Str):
-    ...
+    __slots__ = ()
 
 
 class StackID(Str):
-    ...
+    __slots__ = ()
 
 
 class URLSuffix(Str):
-    ...
+    __slots__ = ()
 
 
 class BridgeStr(str):
     # pylint: disable=too-many-public-methods,arguments-differ
 
-    def __getitem__(self, *args, **kwargs):
-        return BridgeStr(super().__getitem__(*args, **kwargs))
-
     def __add__(self, other):
-        if not isinstance(other, (str, Opaque)):
+        if not isinstance(other, _STR_OR_OPAQUE):
             return NotImplemented
         return BridgeStr("").join([self, other])
 
     def __iter__(self, *args, **kwargs):
-        yield from map(BridgeStr, super().__iter__(*args, **kwargs))
+        return map(BridgeStr, super().__iter__(*args, **kwargs))
 
     def __mod__(self, *args, **kwargs):
         raise NotImplementedError
 
-    def __mul__(self, *args, **kwargs):
-        return BridgeStr(super().__mul__(*args, **kwargs))
-
     def __rmod__(self, *args, **kwargs):
         raise NotImplementedError
 
-    def __rmul__(self, *args, **kwargs):
-        return BridgeStr(super().__rmul__(*args, **kwargs))
-
-    def capitalize(self, *args, **kwargs):
-        return BridgeStr(super().capitalize(*args, **kwargs))
-
-    def casefold(self, *args, **kwargs):
-        return BridgeStr(super().casefold(*args, **kwargs))
-
-    def center(self, *args, **kwargs):
-        return BridgeStr(super().center(*args, **kwargs))
-
-    def expandtabs(self, *args, **kwargs):
-        return BridgeStr(super().expandtabs(*args, **kwargs))
-
     def format(self, *args, **kwargs):
         # See https://github.com/python/cpython/tree/8713aa6/Lib/string.py
-        formatter = string.Formatter()
+        if "{" not in self and "}" not in self:
+            return str(self)
+        formatter = _FORMATTER
         fmt, vals = [], {}
         auto = 0
         for lit, field, spec, conv in formatter.parse(self):
@@ -280,7 +301,13 @@ class BridgeStr(str):
                         "to manual field specification"
                     )
                 auto = False
-            obj, _ = formatter.get_field(field, args, kwargs)
+            # plain positions and names skip the `get_field` machinery
+            if field.isascii() and field.isdigit():
+                obj = args[int(field)]
+            elif field.isidentifier():
+                obj = kwargs[field]
+            else:
+                obj, _ = formatter.get_field(field, args, kwargs)
             if isinstance(obj, Opaque):
                 if spec or conv:
                     err = f"{lit}{{{field}"
@@ -294,9 +321,9 @@ class BridgeStr(str):
                 fmt.append(f"${{{name}}}")
                 vals[name] = obj
             else:
-                obj = formatter.convert_field(obj, conv)
-                obj = formatter.format_field(obj, spec)
-                fmt.append(obj)
+                if conv:
+                    obj = formatter.convert_field(obj, conv)
+                fmt.append(format(obj, spec))
         if vals:
             return Sub("".join(fmt), vals)
         return "".join(fmt)
@@ -305,78 +332,98 @@ class BridgeStr(str):
         raise NotImplementedError
 
     def join(self, iterable):
-        none_idx = next((i for i, v in enumerate(iterable) if v is None), -1)
-        if none_idx != -1:
-            raise TypeError(
-                f"sequence item {none_idx}: expected str instance, NoneType found"
-            )
-        if not any(isinstance(arg, Opaque) for arg in iterable):
-            return BridgeStr(super().join(iterable))
-        return Join(self, iterable)
-
-    def ljust(self, *args, **kwargs):
-        return BridgeStr(super().ljust(*args, **kwargs))
-
-    def lower(self, *args, **kwargs):
-        return BridgeStr(super().lower(*args, **kwargs))
-
-    def lstrip(self, *args, **kwargs):
-        return BridgeStr(super().lstrip(*args, **kwargs))
+        items = list(iterable)  # a single pass, even over generators
+        opaque = False
+        for i, item in enumerate(items):
+            if item is None:
+                raise TypeError(
+                    f"sequence item {i}: expected str instance, NoneType found"
+                )
+            if not opaque and isinstance(item, Opaque):
+                opaque = True
+        if not opaque:
+            return BridgeStr(super().join(items))
+        return Join(self, items)
 
     @staticmethod
     def maketrans(*args, **kwargs):
         raise NotImplementedError
 
-    def partition(self, *args, **kwargs):
-        org = super().partition(*args, **kwargs)
-        return type(org)(map(BridgeStr, org))
-
-    def replace(self, *args, **kwargs):
-        return BridgeStr(super().replace(*args, **kwargs))
-
-    def rjust(self, *args, **kwargs):
-        return BridgeStr(super().rjust(*args, **kwargs))
-
-    def rpartition(self, *args, **kwargs):
-        org = super().rpartition(*args, **kwargs)
-        return type(org)(map(BridgeStr, org))
-
-    def rsplit(self, *args, **kwargs):
-        org = super().rsplit(*args, **kwargs)
-        return type(org)(map(BridgeStr, org))
-
-    def rstrip(self, *args, **kwargs):
-        return BridgeStr(super().rstrip(*args, **kwargs))
-
-    def split(self, *args, **kwargs):
-        org = super().split(*args, **kwargs)
-        return type(org)(map(BridgeStr, org))
-
-    def splitlines(self, *args, **kwargs):
-        org = super().splitlines(*args, **kwargs)
-        return type(org)(map(BridgeStr, org))
-
-    def strip(self, *args, **kwargs):
-        return BridgeStr(super().strip(*args, **kwargs))
-
-    def swapcase(self, *args, **kwargs):
-        return BridgeStr(super().swapcase(*args, **kwargs))
-
-    def title(self, *args, **kwargs):
-        return BridgeStr(super().title(*args, **kwargs))
-
     def translate(self, *args, **kwargs):
         raise NotImplementedError
 
-    def upper(self, *args, **kwargs):
-        return BridgeStr(super().upper(*args, **kwargs))
 
-    def zfill(self, *args, **kwargs):
-        return BridgeStr(super().zfill(*args, **kwargs))
+def _bridge(name: str):
+    meth = getattr(str, name)
+
+    def wrapper(self, *args, **kwargs):
+        return BridgeStr(meth(self, *args, **kwargs))
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = f"BridgeStr.{name}"
+    wrapper.__doc__ = meth.__doc__
+    return wrapper
+
+
+def _bridge_seq(name: str):
+    meth = getattr(str, name)
+
+    def wrapper(self, *args, **kwargs):
+        return [BridgeStr(part) for part in meth(self, *args, **kwargs)]
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = f"BridgeStr.{name}"
+    wrapper.__doc__ = meth.__doc__
+    return wrapper
+
+
+def _bridge_part(name: str):
+    meth = getattr(str, name)
+
+    def wrapper(self, *args, **kwargs):
+        head, sep, tail = meth(self, *args, **kwargs)
+        return (BridgeStr(head), BridgeStr(sep), BridgeStr(tail))
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = f"BridgeStr.{name}"
+    wrapper.__doc__ = meth.__doc__
+    return wrapper
+
+
+# plain delegates calling `str` directly, cheaper than `super()` each time
+for _name in (
+    "__getitem__",
+    "__mul__",
+    "__rmul__",
+    "capitalize",
+    "casefold",
+    "center",
+    "expandtabs",
+    "ljust",
+    "lower",
+    "lstrip",
+    "replace",
+    "rjust",
+    "rstrip",
+    "strip",
+    "swapcase",
+    "title",
+    "upper",
+    "zfill",
+):
+    setattr(BridgeStr, _name, _bridge(_name))
+for _name in ("partition", "rpartition"):
+    setattr(BridgeStr, _name, _bridge_part(_name))
+for _name in ("rsplit", "split", "splitlines"):
+    setattr(BridgeStr, _name, _bridge_seq(_name))
+del _name
 
 
 def fstr(args):
-    if not any(isinstance(a, Opaque) for a in args):
+    for arg in args:  # a plain loop, `any` would resume a generator per arg
+        if isinstance(arg, Opaque):
+            break
+    else:
         return BridgeStr("".join(args))
     fmt = []
     vals: Dict[str, Any] = {}
@@ -401,7 +448,7 @@ def fval(obj, conv, spec):
                 f"opaque: spec and conversion not supported: '{err}'"
             )
         return obj
-    formatter = string.Formatter()
+    formatter = _FORMATTER
     if conv > -1:
         obj = formatter.convert_field(obj, chr(conv))
     return formatter.format_field(obj, spec or "")
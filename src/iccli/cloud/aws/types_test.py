@@ -68,6 +68,32 @@ def test_list():
     assert (got.item, got.args) == (1, val)
 
 
+OPAQUE_TYPES = [
+    types.Bool,
+    types.Int,
+    types.Str,
+    types.List[types.Str],  # type: ignore
+    types.Join,
+    types.Ref,
+    types.Sensitive,
+    types.Split,
+    types.Sub,
+    types.AvailabilityZones,
+    types.Base64Encode,
+    types.CIDR,
+    types.Region,
+]
+
+
+@pytest.mark.parametrize("typ", OPAQUE_TYPES, ids=lambda t: t.__name__)
+def test_subscript(typ):
+    got = types.List[typ]()[0]  # type: ignore
+    assert isinstance(got, types.Select) and isinstance(got, typ)
+    got = types.Attr[typ, "Arn"]("rid")  # type: ignore
+    assert isinstance(got, types.Attr) and isinstance(got, typ)
+    assert (got.rid, got.name) == ("rid", "Arn")
+
+
 def test_sensitive():
     with pytest.raises(TypeError):
         types.Sensitive("dummy", 1)
@@ -158,6 +184,9 @@ def test_bridge_str_special():
     assert isinstance(join, types.Join)
     assert join.delim == "."
 
+    join = types.BridgeStr(".").join(c for c in "ab")
+    assert join == "a.b"
+
 
 def test_bridge_str_format():
     val = types.BridgeStr("- {} -").format(types.BridgeStr("foo"))
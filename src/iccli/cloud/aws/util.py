@@ -17,6 +17,7 @@
 
 import base64
 import hashlib
+import io
 import pathlib
 from functools import lru_cache, partial
 from typing import IO, NamedTuple, Union
@@ -38,18 +39,27 @@ class AssetInfo(NamedTuple):
     key: types.BridgeStr
 
 
+BLOCK_SIZE = 1 << 20
+# pristine state, copying it is cheaper than setting up a new context
+_SHA1 = hashlib.sha1()
+
+
 def asset_info(data: Union[pathlib.Path, IO[bytes]]) -> AssetInfo:
-    hasher = hashlib.sha1()
+    # the digest is part of the S3 key, keep SHA-1 so keys stay stable
+    hasher = _SHA1.copy()
 
     def _hash(reader):
-        for block in iter(partial(reader.read, 65536), b""):
+        for block in iter(partial(reader.read, BLOCK_SIZE), b""):
             hasher.update(block)
 
     if isinstance(data, pathlib.Path):
         with data.open("rb") as ptr:
             _hash(ptr)
+    elif isinstance(data, io.BytesIO):
+        # only when template > 52K, hash the buffer in place
+        with data.getbuffer() as view:
+            hasher.update(view[data.tell() :])
     else:  # pragma: no cover
-        # only when template > 52K
         _hash(data)
     buk = config.S3_BUCKET.get()
     key = f"{config.S3_PREFIX.get()}{hasher.hexdigest()}"
@@ -15,23 +15,31 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
-import calendar
+import base64
 import enum
 import json
 import logging
+import time
+from contextlib import contextmanager
 from contextvars import ContextVar
-from datetime import datetime
+from functools import lru_cache
 from os import environ
 
 import boto3
 import botocore
 import botocore.config
-import jwt
+import botocore.exceptions
 import requests
 import requests.exceptions
 
 from . import config
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # no advisory locks on windows, token refreshes are not serialized
+    fcntl = None  # type: ignore
+
 
 class State(enum.IntEnum):
     _ = enum.auto()
@@ -47,16 +55,47 @@ IDENTITY_ID: ContextVar[str] = ContextVar("identity_id")
 ID_TOKEN: ContextVar[str] = ContextVar("id_token")
 ACCESS_TOKEN: ContextVar[str] = ContextVar("access_token")
 REFRESH_TOKEN: ContextVar[str] = ContextVar("refresh_token")
+EXPIRES_AT: ContextVar[int] = ContextVar("expires_at", default=0)
 SESSION: ContextVar[boto3.Session] = ContextVar("session")
 STATE: ContextVar[State] = ContextVar("state", default=State._)
 REGION: str
 USER_POOL_ID: str
 ID_POOL_ID: str
 CLIENT_ID: str
+AWS_ERRORS = (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError)
+
+
+def expiry(token: str) -> int:
+    """Returns the `exp` claim of the given JWT without verifying it."""
+    if not token:
+        return 0
+    seg = token.split(".")[1]
+    payload = base64.urlsafe_b64decode(seg + "=" * (-len(seg) % 4))
+    return int(json.loads(payload)["exp"])
+
+
+@lru_cache(maxsize=None)
+def cognito(region: str):
+    """Returns the unsigned Cognito Identity client of the given region.
+
+    Building a client loads its service model, so it is only done once
+    and when a call is actually needed.
+
+    """
+    return boto3.client(
+        "cognito-identity",
+        region_name=region,
+        config=botocore.config.Config(
+            signature_version=botocore.UNSIGNED,
+            connect_timeout=1,
+            read_timeout=1,
+            retries={"max_attempts": 1},
+        ),
+    )
 
 
 def init():
-    # pylint: disable=bare-except,global-statement
+    # pylint: disable=global-statement
     global REGION, USER_POOL_ID, ID_POOL_ID, CLIENT_ID
     if not CREDS_PATH.exists():
         data = config.REMOTE_CONFIG.get(None)
@@ -76,67 +115,73 @@ def init():
     ID_TOKEN.set(data.get("id_token", ""))
     ACCESS_TOKEN.set(data.get("access_token", ""))
     REFRESH_TOKEN.set(data.get("refresh_token", ""))
+    # older credentials files do not record the expiry, decode it once
+    EXPIRES_AT.set(data.get("expires_at") or expiry(ACCESS_TOKEN.get()))
     STATE.set(State.INIT)
 
 
+@contextmanager
+def _refresh_lock():
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    path = CREDS_PATH.with_name(f"{CREDS_PATH.name}.lock")
+    with path.open("w") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)  # released when closed
+        yield
+
+
 def load():
-    # pylint: disable=bare-except
     init()
     state = STATE.get()
     if state < State.INIT:
         return
-    cognito = boto3.client(
-        "cognito-identity",
-        region_name=REGION,
-        config=botocore.config.Config(
-            signature_version=botocore.UNSIGNED,
-            connect_timeout=1,
-            read_timeout=1,
-            retries={"max_attempts": 1},
-        ),
-    )
     if ACCESS_TOKEN.get():
-        access_token = jwt.decode(ACCESS_TOKEN.get(), verify=False)
-        now = calendar.timegm(datetime.utcnow().utctimetuple())
-        if int(access_token["exp"]) <= now:
-            token_url = f"{AUTH_URL}/oauth2/token"
-            body = dict(
-                grant_type="refresh_token",
-                client_id=CLIENT_ID,
-                refresh_token=REFRESH_TOKEN.get(),
-            )
-            try:
-                with requests.post(token_url, data=body, timeout=1) as req:
-                    req.raise_for_status()
-                    res = req.json()
-                    ID_TOKEN.set(res["id_token"])
-                    ACCESS_TOKEN.set(res["access_token"])
+        if EXPIRES_AT.get() <= int(time.time()):
+            with _refresh_lock():
+                # another process may have refreshed while we were waiting
+                init()
+                if EXPIRES_AT.get() > int(time.time()):
                     state = State.AUTH
-            except requests.exceptions.ConnectionError:
-                return
-            except:
-                IDENTITY_ID.set("")
-                ID_TOKEN.set("")
-                ACCESS_TOKEN.set("")
-                REFRESH_TOKEN.set("")
-            save()
+                else:
+                    token_url = f"{AUTH_URL}/oauth2/token"
+                    body = dict(
+                        grant_type="refresh_token",
+                        client_id=CLIENT_ID,
+                        refresh_token=REFRESH_TOKEN.get(),
+                    )
+                    try:
+                        with requests.post(token_url, data=body, timeout=1) as req:
+                            req.raise_for_status()
+                            res = req.json()
+                            ID_TOKEN.set(res["id_token"])
+                            ACCESS_TOKEN.set(res["access_token"])
+                            state = State.AUTH
+                    except requests.exceptions.ConnectionError:
+                        return
+                    except (requests.RequestException, ValueError, KeyError):
+                        IDENTITY_ID.set("")
+                        ID_TOKEN.set("")
+                        ACCESS_TOKEN.set("")
+                        REFRESH_TOKEN.set("")
+                    save()
         else:
             state = State.AUTH
     if not IDENTITY_ID.get():
         try:
-            new = cognito.get_id(IdentityPoolId=ID_POOL_ID)
-        except:
+            new = cognito(REGION).get_id(IdentityPoolId=ID_POOL_ID)
+        except AWS_ERRORS:
             return
         IDENTITY_ID.set(new["IdentityId"])
         save()
-    if state == state.INIT:
+    if state == State.INIT:
         state = State.GUEST
     try:
         logins = dict()
         if state == State.AUTH:
             provider = f"cognito-idp.{REGION}.amazonaws.com/{USER_POOL_ID}"
             logins.update({provider: ID_TOKEN.get()})
-        creds = cognito.get_credentials_for_identity(
+        creds = cognito(REGION).get_credentials_for_identity(
             IdentityId=IDENTITY_ID.get(), Logins=logins
         )["Credentials"]
         sess = boto3.Session(
@@ -145,13 +190,14 @@ def load():
             aws_session_token=creds["SessionToken"],
             region_name=REGION,
         )
-    except:
+    except (*AWS_ERRORS, KeyError):
         return
     SESSION.set(sess)
     STATE.set(state)
 
 
 def save():
+    EXPIRES_AT.set(expiry(ACCESS_TOKEN.get("")))
     data = dict(
         version="v1",
         region=REGION,
@@ -162,6 +208,7 @@ def save():
         id_token=ID_TOKEN.get(""),
         access_token=ACCESS_TOKEN.get(""),
         refresh_token=REFRESH_TOKEN.get(""),
+        expires_at=EXPIRES_AT.get(),
     )
     data = {k: v for k, v in data.items() if v}
     CREDS_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -23,9 +23,11 @@ import pathlib
 import re
 from contextvars import ContextVar
 from dataclasses import dataclass, field
+from functools import lru_cache
 from itertools import chain
 from typing import (
     Any,
+    FrozenSet,
     Iterable,
     List,
     Mapping,
@@ -43,11 +45,15 @@ from . import util
 
 LOGGER = logging.getLogger(__name__)
 
-LICENSES: Set[str] = set(
-    json.loads(importlib.resources.read_text(__package__, "licenses.json"))
-)
+RESERVED = frozenset(("assets", "brick", "ic", "icp", "index", "resource"))
+
+_NAME_RE = re.compile(r"[a-z0-9_\.]+")
+_NAME_FMT_RE = re.compile(r"[^.]+\.[^.]+")
+_MAIN_RE = re.compile(r"[a-z0-9_\.]*:[a-z0-9_]+")
+_WS_RE = re.compile(r"\s+")
 
-RESERVED = {"assets", "brick", "ic", "icp", "index", "resource"}
+# manifests are only read, skip the round-trip machinery and use libyaml
+_YAML = YAML(typ="safe", pure=False)
 
 MANIFEST: ContextVar["Manifest"] = ContextVar("manifest")
 TARGET: ContextVar["Brick"] = ContextVar("target")
@@ -101,24 +107,33 @@ def check_name(val: Any):
         err = "must be a string"
     elif val.startswith("."):
         err = "relative name not allowed"
-    elif any(c.isupper() for c in val):
+    elif val != val.lower():
         err = "mixed case, expected lowercase"
-    elif not re.fullmatch(r"[a-z0-9_\.]+", val):
+    elif not _NAME_RE.fullmatch(val):
         err = "invalid chars, expected [a-z0-9_.]"
-    elif not re.fullmatch(r"[^.]+\.[^.]+", val):
+    elif not _NAME_FMT_RE.fullmatch(val):
         err = "invalid format, expected 'namespace.component'"
-    elif any(v[0].isdigit() for v in val.split(".")):
-        err = "parts cannot start with digits"
-    elif any(keyword.iskeyword(v) for v in val.split(".")):
-        err = "parts cannot contain python keywords"
-    elif any(v in RESERVED for v in val.split(".")):
-        err = f"parts cannot contain reserved keywords: {RESERVED}"
-    elif not all(3 <= len(v) <= 20 for v in val.split(".")):
-        err = f"parts must have at least 3 and at most 20 chars"
+    else:
+        parts = val.split(".")
+        if any(v[0].isdigit() for v in parts):
+            err = "parts cannot start with digits"
+        elif any(keyword.iskeyword(v) for v in parts):
+            err = "parts cannot contain python keywords"
+        elif not RESERVED.isdisjoint(parts):
+            reserved = ", ".join(sorted(RESERVED))
+            err = f"parts cannot contain reserved keywords: {reserved}"
+        elif not all(3 <= len(v) <= 20 for v in parts):
+            err = f"parts must have at least 3 and at most 20 chars"
     if err:
         raise util.UserError(f"malformed brick name {val!r}: {err}")
 
 
+@lru_cache(maxsize=512)
+def _parse_semver(val: str) -> semver.VersionInfo:
+    # the same versions come back across require, replace and exclude
+    return semver.VersionInfo.parse(val)
+
+
 def check_version(val: Any):
     """Check that the brick version is valid.
 
@@ -134,7 +149,7 @@ def check_version(val: Any):
         err = "missing 'v' prefix"
     else:
         try:
-            ver = semver.VersionInfo.parse(val[1:])
+            ver = _parse_semver(val[1:])
         except ValueError:
             err = "invalid format, expected semantic version"
         if not err and ver.build:
@@ -155,13 +170,15 @@ def check_id(name: Any, version: Any):
     check_name(name)
     check_version(version)
     assert len(version) > 1
-    ver = semver.VersionInfo.parse(version[1:])
-    if ver.major > 1 and not name.endswith(f"v{ver.major}"):
+    ver = _parse_semver(version[1:])  # cached by check_version
+    major, last = ver.major, name[-1]
+    if major > 1 and not name.endswith(f"v{major}"):
         raise util.UserError(
             f"mismatched brick name {name!r} and version "
-            f"{version!r} (want v{ver.major!r})"
+            f"{version!r} (want v{major!r})"
         )
-    if ver.major <= 1 and not name[-1].islower() or name[-1] == "v":
+    # names are plain ascii at this point (see `check_name`)
+    if last == "v" or major <= 1 and not "a" <= last <= "z":
         raise util.UserError(
             f"malformed brick name {name!r}: expected to end with a letter != 'v'"
         )
@@ -173,6 +190,14 @@ def check_private(val: Any):
         raise util.UserError("invalid private: expected a boolean")
 
 
+@lru_cache(maxsize=None)
+def _licenses() -> FrozenSet[str]:
+    # most commands never check a license, read the SPDX list on demand
+    return frozenset(
+        json.loads(importlib.resources.read_text(__package__, "licenses.json"))
+    )
+
+
 def check_license(val: Any, private: bool = False):
     """Check that the brick license is valid.
 
@@ -188,7 +213,7 @@ def check_license(val: Any, private: bool = False):
             err = "valid license required"
         elif not isinstance(val, str):
             err = "must be a string"
-        elif val not in LICENSES:
+        elif val not in _licenses():
             err = "unknown, expected SPDX"
     if err:
         raise util.UserError(f"malformed brick license {val!r}: {err}")
@@ -222,15 +247,23 @@ def check_main(val: Any):
         err = "must be a string"
     elif not val.startswith(".") and not val.startswith(":"):
         err = "must be a relative path"
-    elif not re.fullmatch(r"[a-z0-9_\.]*:[a-z0-9_]+", val):
+    elif not _MAIN_RE.fullmatch(val):
         err = "invalid format, expected 'path:definition'"
     if err:
         raise util.UserError(f"malformed brick main {val!r}: {err}")
 
 
+def glob(root: pathlib.Path, patterns: Iterable[Any]) -> Set[pathlib.Path]:
+    """Returns the union of `root.glob(pattern)` for all the patterns.
+
+    Repeated patterns are only globbed once.
+
+    """
+    return set(chain.from_iterable(root.glob(p) for p in dict.fromkeys(patterns)))
+
+
 def parse(root: pathlib.Path = None, data: Mapping = None) -> Manifest:
     """Extract the brick.yaml's info from the given directory."""
-    yaml = YAML()
     if not data:
         assert root
         file = root.joinpath("brick.yaml")
@@ -238,7 +271,7 @@ def parse(root: pathlib.Path = None, data: Mapping = None) -> Manifest:
             raise FileNotFoundError("brick.yaml not found")
         try:
             raw = file.read_text()
-            data = yaml.load(raw) or {}
+            data = _YAML.load(raw) or {}
         except YAMLError as exc:
             LOGGER.error("%s:\n%s", str(file), str(exc))
             raise util.UserError("cannot parse brick.yaml")
@@ -264,7 +297,7 @@ def parse(root: pathlib.Path = None, data: Mapping = None) -> Manifest:
     licn = data.get("license")
     if not priv:
         check_license(licn, priv)
-    desc = re.sub(r"\s+", " ", data.get("description", "")).strip()
+    desc = _WS_RE.sub(" ", data.get("description", "")).strip()
     check_description(desc)
     main = data.get("main", "")
     check_main(main)
@@ -319,5 +352,5 @@ def parse(root: pathlib.Path = None, data: Mapping = None) -> Manifest:
         raw_ass = data.get("assets", [])
         if not isinstance(raw_ass, list):
             raise util.UserError("invalid assets: expected a list")
-        ass = set(chain.from_iterable(root.glob(a) for a in raw_ass))
+        ass = glob(root, raw_ass)
     return Manifest(name, ver, licn, priv, desc, main, req, repl, excl, ass)
@@ -15,13 +15,15 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
+from itertools import chain
+
 import pytest
 
 from . import brick, util
 
-CHECK_NAME_INVALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [
+CHECK_NAME_INVALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [
         ("empty", ""),
         ("type", 1),
         ("relative", ".org.com"),
@@ -33,8 +35,8 @@ CHECK_NAME_INVALID_TESTS = map(
         ("reserved", "icp.brick"),
         ("min", "xy.z"),
         ("max", f"{'x'*21}.{'y'*21}"),
-    ],
-)
+    ]
+]
 
 
 @pytest.mark.parametrize("val", CHECK_NAME_INVALID_TESTS)
@@ -43,10 +45,10 @@ def test_check_name_invalid(val):
         brick.check_name(val)
 
 
-CHECK_NAME_VALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [("simple", "org.com"), ("complex", "complex_org1.complex_comv2")],
-)
+CHECK_NAME_VALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [("simple", "org.com"), ("complex", "complex_org1.complex_comv2")]
+]
 
 
 @pytest.mark.parametrize("val", CHECK_NAME_VALID_TESTS)
@@ -54,17 +56,17 @@ def test_check_name_valid(val):
     brick.check_name(val)
 
 
-CHECK_VERSION_INVALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [
+CHECK_VERSION_INVALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [
         ("empty", ""),
         ("type", 1),
         ("prefix", "1.2.3"),
         ("patch", "v1.2"),
         ("minor", "v1"),
         ("build", "v1.2.3+build"),
-    ],
-)
+    ]
+]
 
 
 @pytest.mark.parametrize("val", CHECK_VERSION_INVALID_TESTS)
@@ -73,10 +75,9 @@ def test_check_version_invalid(val):
         brick.check_version(val)
 
 
-CHECK_VERSION_VALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [("simple", "v1.2.3"), ("pre", "v1.2.3-pre")],
-)
+CHECK_VERSION_VALID_TESTS = [
+    pytest.param(*t[1:], id=t[0]) for t in [("simple", "v1.2.3"), ("pre", "v1.2.3-pre")]
+]
 
 
 @pytest.mark.parametrize("val", CHECK_VERSION_VALID_TESTS)
@@ -84,15 +85,15 @@ def test_check_version_valid(val):
     brick.check_version(val)
 
 
-CHECK_ID_INVALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [
+CHECK_ID_INVALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [
         ("mismatch_1", "org.com", "v2.0.0"),
         ("mismatch_2", "org.comv2", "v1.0.0"),
         ("endwith_v", "org.comv", "v1.0.0"),
         ("endwith_digit", "org.com1", "v1.0.0"),
-    ],
-)
+    ]
+]
 
 
 @pytest.mark.parametrize("name,version", CHECK_ID_INVALID_TESTS)
@@ -103,14 +104,14 @@ def test_check_id_invalid(name, version, mocker):
         brick.check_id(name, version)
 
 
-CHECK_ID_VALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [
+CHECK_ID_VALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [
         ("v0", "org.com", "v0.1.0"),
         ("v1", "org.com", "v1.0.0"),
         ("v2", "org.comv2", "v2.0.0"),
-    ],
-)
+    ]
+]
 
 
 @pytest.mark.parametrize("name,version", CHECK_ID_VALID_TESTS)
@@ -120,9 +121,7 @@ def test_check_id_valid(name, version, mocker):
     brick.check_id(name, version)
 
 
-CHECK_PRIVATE_INVALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]), [("type", 1)]
-)
+CHECK_PRIVATE_INVALID_TESTS = [pytest.param(*t[1:], id=t[0]) for t in [("type", 1)]]
 
 
 @pytest.mark.parametrize("val", CHECK_PRIVATE_INVALID_TESTS)
@@ -131,15 +130,15 @@ def test_check_private_invalid(val):
         brick.check_private(val)
 
 
-CHECK_LICENSE_INVALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [
+CHECK_LICENSE_INVALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [
         ("type_private", 1, True),
         ("type_public", 1, False),
         ("empty", "", False),
         ("spdx", "DUMMY", False),
-    ],
-)
+    ]
+]
 
 
 @pytest.mark.parametrize("val,private", CHECK_LICENSE_INVALID_TESTS)
@@ -148,14 +147,14 @@ def test_check_license_invalid(val, private):
         brick.check_license(val, private)
 
 
-CHECK_LICENSE_VALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [
+CHECK_LICENSE_VALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [
         ("private", "ANYTHING", True),
         ("public_1", "MIT", False),
         ("public_2", "Apache-2.0", False),
-    ],
-)
+    ]
+]
 
 
 @pytest.mark.parametrize("val,private", CHECK_LICENSE_VALID_TESTS)
@@ -163,9 +162,9 @@ def test_check_license_valid(val, private):
     brick.check_license(val, private)
 
 
-CHECK_DESCRIPTION_INVALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]), [("type", 1), ("length", "x" * 141)]
-)
+CHECK_DESCRIPTION_INVALID_TESTS = [
+    pytest.param(*t[1:], id=t[0]) for t in [("type", 1), ("length", "x" * 141)]
+]
 
 
 @pytest.mark.parametrize("val", CHECK_DESCRIPTION_INVALID_TESTS)
@@ -174,9 +173,9 @@ def test_description_main_invalid(val):
         brick.check_description(val)
 
 
-CHECK_DESCRIPTION_VALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]), [("simple", "x" * 140)]
-)
+CHECK_DESCRIPTION_VALID_TESTS = [
+    pytest.param(*t[1:], id=t[0]) for t in [("simple", "x" * 140)]
+]
 
 
 @pytest.mark.parametrize("val", CHECK_DESCRIPTION_VALID_TESTS)
@@ -184,10 +183,15 @@ def test_check_description_valid(val):
     brick.check_description(val)
 
 
-CHECK_MAIN_INVALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [("empty", ""), ("type", 1), ("absolute", "foo.bar:brick"), ("format", ".foo.bar")],
-)
+CHECK_MAIN_INVALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [
+        ("empty", ""),
+        ("type", 1),
+        ("absolute", "foo.bar:brick"),
+        ("format", ".foo.bar"),
+    ]
+]
 
 
 @pytest.mark.parametrize("val", CHECK_MAIN_INVALID_TESTS)
@@ -196,12 +200,43 @@ def test_check_main_invalid(val):
         brick.check_main(val)
 
 
-CHECK_MAIN_VALID_TESTS = map(
-    lambda t: pytest.param(*t[1:], id=t[0]),
-    [("complete", ".foo.bar:brick"), ("shortcut", ":brick")],
-)
+CHECK_MAIN_VALID_TESTS = [
+    pytest.param(*t[1:], id=t[0])
+    for t in [("complete", ".foo.bar:brick"), ("shortcut", ":brick")]
+]
 
 
 @pytest.mark.parametrize("val", CHECK_MAIN_VALID_TESTS)
 def test_check_main_valid(val):
     brick.check_main(val)
+
+
+GLOB_PATTERNS = [
+    "*",
+    "*/",
+    "**",
+    "**/*.txt",
+    "a/*",
+    "a/**",
+    "l/**",
+    "*/x.txt",
+    "*/*/*",
+    "**/b/**/*.png",
+    "a/b/?/*.[!t]*",
+    "[ar].txt",
+    "a/b",
+    "missing",
+]
+
+
+@pytest.mark.parametrize("pat", GLOB_PATTERNS)
+def test_glob(tmp_path, pat):
+    for name in ["a/x.txt", "a/b/y.txt", "a/b/c/z.png", ".h/q.txt", "r.txt"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    (tmp_path / "e").mkdir()
+    (tmp_path / "l").symlink_to(tmp_path / "a")
+    assert brick.glob(tmp_path, [pat]) == set(tmp_path.glob(pat))
+    want = set(chain.from_iterable(tmp_path.glob(p) for p in GLOB_PATTERNS))
+    assert brick.glob(tmp_path, GLOB_PATTERNS + [pat]) == want
@@ -16,7 +16,7 @@
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
 
 import click
 
@@ -26,6 +26,10 @@ from . import cmd_dump, cmd_id, cmd_setup, cmd_tree, cmd_update, cmd_value
 from . import util as aws_util
 
 ALIASES = dict(up="update")
+INVERTED_ALIASES: Dict[str, List[str]] = dict()
+for _key, _value in ALIASES.items():
+    INVERTED_ALIASES.setdefault(_value, list()).append(_key)
+del _key, _value
 
 
 class AliasedGroup(click.Group):
@@ -51,12 +55,8 @@ class AliasedGroup(click.Group):
             if hasattr(command, 'hidden') and command.hidden:
                 continue
 
-            inverted_aliases = dict()
-            for key, value in ALIASES.items():
-                inverted_aliases.setdefault(value, list()).append(key)
-
-            if sub_command in inverted_aliases:
-                vals = inverted_aliases[sub_command]
+            if sub_command in INVERTED_ALIASES:
+                vals = INVERTED_ALIASES[sub_command]
                 sub_command = f'{sub_command} {{{", ".join(vals)}}}'
 
             cmd_help = command.get_short_help_str(limit)
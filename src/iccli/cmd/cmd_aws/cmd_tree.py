@@ -16,16 +16,18 @@
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
 import json
-from typing import Mapping, Optional
+from typing import TYPE_CHECKING, Mapping, Optional
 
 import botocore.exceptions
 import click
-import treelib
 
 from ...cloud.aws import encode
 from .. import util as cli_util
 from . import load, stack
 
+if TYPE_CHECKING:  # pragma: no cover
+    import treelib
+
 
 @click.command(name="tree")
 @click.option("--params", "overrides", help="Parameter overrides.")
@@ -54,7 +56,10 @@ def cmd(
         except botocore.exceptions.ClientError as exc:
             raise cli_util.UserError(f"aws: {exc}")
     else:
-        node, _ = load.execute("brick", name, version, overrides, s3_bucket, s3_prefix)
+        # only the hierarchy is displayed, nothing is uploaded
+        node, _ = load.execute(
+            "brick", name, version, overrides, s3_bucket, s3_prefix, check_assets=False
+        )
         tree = encode.Template(node).tree
     if raw:
         click.echo(json.dumps(tree))
@@ -63,15 +68,20 @@ def cmd(
 
 
 def format_tree(data: Mapping) -> str:
+    import treelib  # pylint: disable=import-outside-toplevel
+
     tree = treelib.Tree()
     _format_tree(tree, data)
     return str(tree).strip("\n")
 
 
-def _format_tree(tree: treelib.Tree, data: Mapping, parent=None):
-    text = data["name"]
-    if "type" in data:
-        text += " " + click.style(data["type"], dim=True)
-    parent = tree.create_node(text, data["id"], parent)
-    for child in data.get("children", []):
-        _format_tree(tree, child, parent)
+def _format_tree(tree: "treelib.Tree", data: Mapping):
+    # depth-first in document order, children are pushed reversed
+    stack = [(data, None)]
+    while stack:
+        data, parent = stack.pop()
+        text = data["name"]
+        if "type" in data:
+            text += " " + click.style(data["type"], dim=True)
+        node = tree.create_node(text, data["id"], parent)
+        stack.extend((c, node) for c in reversed(data.get("children", [])))
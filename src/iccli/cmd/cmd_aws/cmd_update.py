@@ -15,7 +15,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
-import asyncio
 import io
 import json
 import logging
@@ -23,9 +22,9 @@ import pathlib
 import re
 import sys
 import weakref
-from collections import deque
 from typing import (
     IO,
+    TYPE_CHECKING,
     Dict,
     Iterable,
     Iterator,
@@ -39,8 +38,6 @@ from typing import (
 )
 
 import click
-import treelib
-import urwid
 from pygments import formatters, highlight, lexers
 
 from ...cloud.aws import config, encode
@@ -48,6 +45,9 @@ from ...cloud.aws import util as aws_util
 from .. import util as cli_util
 from . import load, stack, util
 
+if TYPE_CHECKING:  # pragma: no cover
+    import treelib
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -105,9 +105,10 @@ def cmd(
     tplb = body.encode("utf-8")
     artifacts: List[Tuple[Union[pathlib.Path, IO[bytes]], aws_util.AssetInfo]] = []
     if len(tplb) > 51_000:  # pragma: no cover
-        info = aws_util.asset_info(io.BytesIO(tplb))
+        buf = io.BytesIO(tplb)
+        info = aws_util.asset_info(buf)  # hashes in place, position unchanged
         body = info.url
-        artifacts.append((io.BytesIO(tplb), info))
+        artifacts.append((buf, info))
     # pylint: disable=protected-access
     artifacts += [(a._path, cast(aws_util.AssetInfo, a)) for a in config.ASSETS.get()]
     util.upload(artifacts)
@@ -134,7 +135,7 @@ def cmd(
 
 
 def _display(
-    tree: treelib.Tree,
+    tree: "treelib.Tree",
     states: Iterator[Dict[str, stack.State]],
     state: Mapping[str, stack.State],
     yes: bool,
@@ -149,7 +150,8 @@ def _display(
     if sys.stdout.isatty():  # pragma: no cover
         state = _animate(tree, states)
     else:
-        state = deque(states, maxlen=1)[0]
+        for state in states:  # only the last state is displayed
+            pass
     click.secho("\nPlan summary\n", fg="magenta")
     click.echo(_format_base(_prune(tree, set(state.keys())), state))
     logs = _logs(tree, state)
@@ -159,45 +161,48 @@ def _display(
         raise cli_util.UserError("plan execution failed")
 
 
-def _merge(*info: Mapping) -> treelib.Tree:
+def _merge(*info: Mapping) -> "treelib.Tree":
+    import treelib  # pylint: disable=import-outside-toplevel
+
     res = treelib.Tree()
     root = res.create_node("plan", "root", None, dict())
-
-    def _process(tree: treelib.Tree, data: Mapping, parent: treelib.Node):
+    # depth-first in document order, children are pushed reversed
+    stack = [(elem, root) for elem in reversed(info)]
+    while stack:
+        data, parent = stack.pop()
         if not data:
-            return
+            continue
         name, idn = data["name"], data["id"]
-        if idn in tree:
-            parent = tree[idn]
+        if idn in res:
+            node = res[idn]
         else:
-            parent = tree.create_node(name, idn, parent, data)
-        for child in data.get("children", []):
-            _process(tree, child, parent)
-
-    for elem in info:
-        _process(res, elem, root)
+            node = res.create_node(name, idn, parent, data)
+        stack.extend((c, node) for c in reversed(data.get("children", [])))
     return res
 
 
-def _prune(tree: treelib.Tree, retain: Set[str]) -> treelib.Tree:
+def _prune(tree: "treelib.Tree", retain: Set[str]) -> "treelib.Tree":
+    import treelib  # pylint: disable=import-outside-toplevel
+
     res = treelib.Tree()
     res.create_node(tree[tree.root].tag, tree.root, None, tree[tree.root].data)
-    for path in tree.paths_to_leaves():
-        if path[-1] in retain:
-            for i, node in enumerate(path[1:]):
-                if node not in res:
-                    curr = tree[node]
-                    res.create_node(curr.tag, node, res[path[i]], curr.data)
-
+    for nid in tree.nodes:  # same order as `paths_to_leaves`
+        if nid not in retain or tree.is_branch(nid):
+            continue
+        # climb only up to the first ancestor already kept
+        path: List[Tuple[str, str]] = []
+        while nid not in res:
+            parent = tree.parent(nid).identifier
+            path.append((nid, parent))
+            nid = parent
+        for nid, parent in reversed(path):
+            curr = tree[nid]
+            res.create_node(curr.tag, nid, parent, curr.data)
     return res
 
 
-def _logs(tree: treelib.Tree, state: Mapping[str, stack.State]) -> Iterable[str]:
-    res = []
-    for key, val in state.items():
-        if val.logs:
-            res.extend([f"{tree[key].tag}: {l}" for l in val.logs])
-    return res
+def _logs(tree: "treelib.Tree", state: Mapping[str, stack.State]) -> Iterable[str]:
+    return [f"{tree[key].tag}: {l}" for key, val in state.items() for l in val.logs]
 
 
 STATUS_TRANS = dict(
@@ -229,23 +234,22 @@ STATUS_TRANS = dict(
     },
     other={"DELETE_SKIPPED", "PRISTINE", "REPLACE", "DELETE"},
 )
+# the groups above are disjoint, flatten them for a single lookup
+STATUS_CAT = {s: cat for cat, group in STATUS_TRANS.items() for s in group}
+CAT_COLOR = dict(progress="blue", failed="red", complete="green", other="yellow")
 
 OP_TRANS = dict(CREATE="✚", UPDATE="⬆", DELETE="✖", REPLACE="⏏")
+TOKEN_RE = re.compile(r"([A-Z_\S]+)")
 
 
-def _format_base(tree: treelib.Tree, state: Mapping[str, stack.State]) -> str:
-    for node in tree.filter_nodes(lambda n: n.identifier in state):
-        nid, data = node.identifier, node.data
+def _format_base(tree: "treelib.Tree", state: Mapping[str, stack.State]) -> str:
+    for nid in state:
+        if nid not in tree:
+            continue
+        node = tree[nid]
+        data = node.data
         status = state[nid].status[-1]
-        color = None
-        if status in STATUS_TRANS["progress"]:
-            color = "blue"
-        elif status in STATUS_TRANS["failed"]:
-            color = "red"
-        elif status in STATUS_TRANS["complete"]:
-            color = "green"
-        elif status in STATUS_TRANS["other"]:
-            color = "yellow"
+        color = CAT_COLOR.get(STATUS_CAT.get(status, ""))
         text = OP_TRANS[state[nid].status[0]]
         text += " " + node.tag
         text += " " + click.style(status, fg=color)
@@ -256,10 +260,13 @@ def _format_base(tree: treelib.Tree, state: Mapping[str, stack.State]) -> str:
 
 
 def _format_anim(
-    tree: treelib.Tree, state: Mapping[str, stack.State]
+    tree: "treelib.Tree", state: Mapping[str, stack.State]
 ) -> Iterable[Union[Tuple[str, str], str]]:  # pragma: no cover
-    for node in tree.filter_nodes(lambda n: n.identifier in state):
-        nid, data = node.identifier, node.data
+    for nid in state:
+        if nid not in tree:
+            continue
+        node = tree[nid]
+        data = node.data
         text = OP_TRANS[state[nid].status[0]]
         text += " " + node.tag
         text += " " + state[nid].status[-1]
@@ -268,17 +275,11 @@ def _format_anim(
         node.tag = text
     base = str(tree).strip("\n")
     res: List[Union[Tuple[str, str], str]] = []
-    for token in re.split(r"([A-Z_\S]+)", base):
+    for token in TOKEN_RE.split(base):
         if token in {"UPDATE", "CREATE", "REPLACE", "DELETE"}:
             res.append(("progress", f"PENDING_{token}"))
-        elif token in STATUS_TRANS["progress"]:
-            res.append(("progress", token))
-        elif token in STATUS_TRANS["failed"]:
-            res.append(("failed", token))
-        elif token in STATUS_TRANS["complete"]:
-            res.append(("complete", token))
-        elif token in STATUS_TRANS["other"]:
-            res.append(("other", token))
+        elif token in STATUS_CAT:
+            res.append((STATUS_CAT[token], token))
         elif len(token.split(".")) == 3:
             res.append(("type", token))
         else:
@@ -287,8 +288,13 @@ def _format_anim(
 
 
 def _animate(
-    tree: treelib.Tree, states: Iterator[Dict[str, stack.State]]
+    tree: "treelib.Tree", states: Iterator[Dict[str, stack.State]]
 ) -> Dict[str, stack.State]:  # pragma: no cover
+    # only needed on a terminal, and urwid is slow to import
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+    import urwid
+
     palette = [
         ("progress", "light blue", ""),
         ("failed", "light red", ""),
@@ -83,6 +83,7 @@ def definition(name: Optional[str], version: Optional[str]) -> Callable:
             if brk.version:
                 parts = brk.name.split(".")
                 index[parts[0]][parts[1]] = brk
+        aws_importer.Loader.preload(brick.ROOT.get(), ".ic")
         mode_token = core_config.MODE.set(core_config.Mode.IC)
         sys.meta_path.insert(0, core_importer.LibFinder())
         sys.meta_path.insert(1, rescs_importer.Finder())
@@ -161,6 +162,8 @@ def execute(
     overrides: Optional[str],
     s3_bucket: Optional[str],
     s3_prefix: Optional[str],
+    *,
+    check_assets: bool = True,
 ) -> Tuple[resources.Resource, str]:
     if name and all(c not in name for c in (".", ":")):
         if version or idn:
@@ -183,7 +186,7 @@ def execute(
     params = parameters(defn, overrides)
     node = defn(idn, **params)
     used_assets = aws_config.ASSETS.get()
-    if brick.TARGET.get(brick.Brick("", "")).name:
+    if check_assets and brick.TARGET.get(brick.Brick("", "")).name:
         decl_assets = brick.MANIFEST.get().assets
         for asset in used_assets:
             if not s3_bucket:
@@ -17,6 +17,8 @@
 
 import logging
 import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from typing import IO, Iterable, Optional, Tuple, Union
 
@@ -31,6 +33,8 @@ from .. import config as cli_config
 from .. import util
 
 LOGGER = logging.getLogger(__name__)
+# stays below the default botocore connection pool size (10)
+UPLOAD_WORKERS = 8
 
 
 def init_session(profile: Optional[str], region: Optional[str]):
@@ -60,21 +64,26 @@ def upload(
         raise util.UserError("missing aws s3 bucket")
 
     client = config.SESSION.get().client("s3")
+    # context variables are not seen by the pool threads, resolve them here
+    bucket = config.S3_BUCKET.get()
+    root = brick.ROOT.get(pathlib.Path.cwd())
+    lock = threading.Lock()
     dest_logged = False
 
     def log_op(loc, key):
         nonlocal dest_logged
-        if not dest_logged:
-            LOGGER.info("bucket s3://%s", config.S3_BUCKET.get())
-            dest_logged = True
+        with lock:
+            if not dest_logged:
+                LOGGER.info("bucket s3://%s", bucket)
+                dest_logged = True
         LOGGER.info("upload %s -> %s", loc, key)
 
-    for data, info in artifacts:
+    def upload_one(artifact):
+        data, info = artifact
         with suppress(botocore.exceptions.ClientError):
             client.head_object(Bucket=info.bucket, Key=info.key)
-            continue
+            return
         if isinstance(data, pathlib.Path):
-            root = brick.ROOT.get(pathlib.Path.cwd())
             if cli_config.INDEX_PATH in data.parents:
                 loc = f"index:{str(data.relative_to(cli_config.INDEX_PATH))}"
             else:
@@ -86,3 +95,8 @@ def upload(
             loc = "brick:<generated template>"
             log_op(loc, info.key)
             client.upload_fileobj(data, info.bucket, info.key)
+
+    # each artifact costs at least one round trip, overlap them
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+        for _ in pool.map(upload_one, artifacts):
+            pass
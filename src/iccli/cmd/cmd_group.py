@@ -24,6 +24,7 @@ from typing import List, Optional
 import click
 import pkg_resources
 
+from ..core import config as core_config
 from . import (
     auth,
     cmd_config,
@@ -82,6 +83,7 @@ def cmd(ctx, *, debug, profile):
     """Bricks and mortar for cloud developers."""
     util.configure_logger(debug or logging.INFO)
     config.load(profile)
+    core_config.PYCACHE.set(config.PYCACHE_PATH)
     check_version()
     sub = ctx.invoked_subcommand
     if profile not in config.CONFIG.get() and sub not in ("config", "aws"):
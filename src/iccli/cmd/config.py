@@ -29,6 +29,7 @@ from . import util
 HOME_PATH = Path(environ.get("ICHOME", Path.home() / ".ic")).resolve()
 CACHE_PATH = HOME_PATH / "cache"
 INDEX_PATH = HOME_PATH / "index"
+PYCACHE_PATH = HOME_PATH / "pycache"
 CONFIG_PATH = HOME_PATH / "config.ini"
 PROXY_URL = environ.get("ICPROXY", "https://api.ic.dev")
 PROFILE: ContextVar[str] = ContextVar("profile")
@@ -16,6 +16,7 @@
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
 import enum
+import pathlib
 from contextvars import ContextVar
 
 
@@ -25,3 +26,5 @@ class Mode(enum.Enum):
 
 
 MODE: ContextVar[Mode] = ContextVar("mode")
+# directory of the rewritten module bytecode; no caching when unset
+PYCACHE: ContextVar[pathlib.Path] = ContextVar("pycache")
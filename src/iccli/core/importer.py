@@ -16,17 +16,30 @@
 # along with IC CLI. If not, see <https://www.gnu.org/licenses/>.
 
 import ast
+import hashlib
 import importlib.abc
 import importlib.machinery
 import importlib.util
 import io
+import marshal
+import os
 import pathlib
-from functools import partial
-from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from functools import lru_cache, partial
+from types import CodeType, ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from . import config, resource
 
+PRELOAD_MIN = 8  # minimum number of uncached modules to rewrite in parallel
+PRELOAD_SKIP = frozenset({"node_modules", "__pycache__"})
+
+# (loader, filename) -> (source, cache path) read and hashed by the preload,
+# consumed by the import that follows so each source is only hashed once
+_PRELOADED: Dict[Tuple[Type["Loader"], str], Tuple[bytes, pathlib.Path]] = {}
+
 
 class LibFinder(importlib.abc.MetaPathFinder):
     @staticmethod
@@ -132,13 +145,102 @@ class Loader(importlib.abc.Loader, ast.NodeTransformer):
         assert module.__spec__
         if not module.__spec__.has_location:
             return
-        src = pathlib.Path(module.__file__).read_text(encoding="utf-8")
-        tree = ast.parse(source=src, filename=module.__file__)
-        tree = ast.fix_missing_locations(self.visit(tree))
-        code = compile(source=tree, filename=module.__file__, mode="exec")
+        filename = module.__file__
+        src, path = _PRELOADED.pop((type(self), filename), (None, None))
+        if src is None:
+            src = pathlib.Path(filename).read_bytes()
+        code = self._code(src, filename, path)
         setattr(module, "__builtins__", self.builtins)
         exec(code, vars(module))  # pylint: disable=exec-used
 
+    @classmethod
+    def preload(cls, root: pathlib.Path, suffix: str):
+        """Rewrite the uncached importable modules under root in parallel.
+
+        The results land in the bytecode cache, where the imports that
+        follow will find them.
+
+        """
+        cache = config.PYCACHE.get(None)
+        if cache is None:
+            return
+        loader = cls()
+        misses = []
+        _PRELOADED.clear()
+        for dirpath, dirs, files in os.walk(root):
+            dirs[:] = [
+                d
+                for d in dirs
+                if not d.startswith(".")
+                and d not in PRELOAD_SKIP
+                and d.isidentifier()  # the others cannot be imported
+            ]
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                if ext != suffix or not stem.isidentifier():
+                    continue
+                path = os.path.join(dirpath, name)
+                with suppress(OSError):
+                    with open(path, "rb") as file:
+                        src = file.read()
+                    cached = loader._cache_path(cache, src, path)
+                    if cached is None:
+                        return  # bytecode not cached at all
+                    _PRELOADED[cls, path] = (src, cached)
+                    if not cached.exists():
+                        misses.append((path, src, cached))
+        if len(misses) < PRELOAD_MIN:
+            return  # not worth the worker processes
+        workers = min(len(misses), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(partial(_preload, cls, cache), misses))
+
+    def _cache_path(
+        self, cache: pathlib.Path, src: bytes, filename: str
+    ) -> Optional[pathlib.Path]:
+        # <source key>.<content key>.pyc, the former locates the stale entries
+        fingerprint = _fingerprint(type(self))
+        if fingerprint is None:
+            return None  # no way to tell stale bytecode, do not cache
+        kind = f"{type(self).__module__}.{type(self).__qualname__}"
+        key = hashlib.blake2b(digest_size=10)
+        key.update(f"{kind}\0{filename}".encode("utf-8"))
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(importlib.util.MAGIC_NUMBER)
+        hasher.update(fingerprint)
+        hasher.update(src)
+        return cache / f"{key.hexdigest()}.{hasher.hexdigest()}.pyc"
+
+    def _code(
+        self, src: bytes, filename: str, path: Optional[pathlib.Path] = None
+    ) -> CodeType:
+        cache = config.PYCACHE.get(None)
+        if cache is None:
+            return self._rewrite(src, filename)
+        if path is None or path.parent != cache:
+            path = self._cache_path(cache, src, filename)
+            if path is None:
+                return self._rewrite(src, filename)
+        with suppress(OSError, EOFError, ValueError, TypeError):
+            return marshal.loads(path.read_bytes())
+        code = self._rewrite(src, filename)
+        with suppress(OSError):
+            cache.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(marshal.dumps(code))
+            tmp.replace(path)
+            key = path.name.partition(".")[0]
+            for stale in cache.glob(f"{key}.*.pyc"):
+                if stale != path:
+                    with suppress(OSError):
+                        stale.unlink()
+        return code
+
+    def _rewrite(self, src: bytes, filename: str) -> CodeType:
+        tree = ast.parse(source=src.decode("utf-8"), filename=filename)
+        tree = ast.fix_missing_locations(self.visit(tree))
+        return compile(source=tree, filename=filename, mode="exec")
+
     @staticmethod
     def get_resource_reader(name: str):
         module = importlib.import_module(name)
@@ -147,6 +249,33 @@ class Loader(importlib.abc.Loader, ast.NodeTransformer):
         return Reader(pathlib.Path(module.__spec__.submodule_search_locations[0]))
 
 
+@lru_cache(maxsize=None)
+def _fingerprint(loader: Type[Loader]) -> Optional[bytes]:
+    # the files of the modules implementing the rewrite, any change to them
+    # invalidates the cached bytecode, None when they cannot be read
+    hasher = hashlib.blake2b(digest_size=20)
+    for module in sorted({c.__module__ for c in loader.mro() if issubclass(c, Loader)}):
+        file = getattr(sys.modules[module], "__file__", None)
+        if not file:
+            return None  # frozen
+        try:
+            hasher.update(pathlib.Path(file).read_bytes())
+        except OSError:  # zipapp, ...
+            return None
+    return hasher.digest()
+
+
+def _preload(
+    loader: Type[Loader], cache: pathlib.Path, miss: Tuple[str, bytes, pathlib.Path]
+):
+    # pylint: disable=protected-access
+    config.PYCACHE.set(cache)
+    filename, src, path = miss
+    # invalid sources, reported again by the actual import if ever imported
+    with suppress(OSError, SyntaxError, UnicodeDecodeError, NotImplementedError):
+        loader()._code(src, filename, path)
+
+
 def import_module(
     name: str,
     globals_: Dict[str, Any],
@@ -22,7 +22,7 @@ import re
 from contextvars import ContextVar, copy_context
 from functools import wraps
 from types import MethodType
-from typing import Any, Iterable, Iterator, MutableMapping, Optional, cast
+from typing import Any, Iterable, Iterator, List, MutableMapping, Optional, cast
 
 LOGGER = logging.getLogger(__name__)
 PARENT: ContextVar[Optional["Resource"]] = ContextVar("parent")
@@ -42,6 +42,8 @@ class Resource:
 
     # pylint: disable=invalid-name
 
+    __slots__ = ("_name", "_value", "_children", "_parent")
+
     def __init__(self, name: str):
         check_name(name)
         self._name = name
@@ -75,9 +77,12 @@ class Resource:
         return list(self._children.values())
 
     def __iter__(self) -> Iterator["Resource"]:
-        yield self
-        for child in self.children:
-            yield from child
+        # pre-order walk without nesting one generator per level
+        stack: List["Resource"] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node._children.values())))
 
     def __hash__(self):
         return hash(self.lineage)